@@ -1,204 +1,385 @@
-from fastapi import Depends, FastAPI, HTTPException
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import zlib
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, List, Literal, Optional
+
+import anyio
+import orjson
+from cachetools import TTLCache
+
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter, ValidationError
 
 from app.ml.ml_logic import DraftMLModel
-from app.models.database import get_db
-from app.models.models import DraftRequest, DraftResponse
+from app.models.models import DraftRequest, DraftResponse, RosterCounts
+
+logger = logging.getLogger(__name__)
+
+# Sync endpoints run in anyio's worker threads; raise the default cap of 40
+THREADPOOL_SIZE = 64
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
 
 app = FastAPI(
-    title="Gridiron Guru AI - Fantasy Football Draft Assistant", version="1.0.0"
+    title="Gridiron Guru AI - Fantasy Football Draft Assistant",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
+# Explicit methods/headers keep Starlette off the wildcard path, and max_age lets
+# browsers cache preflight responses instead of sending OPTIONS before every POST
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your frontend domain
+    # In production, set CORS_ORIGINS to your frontend domain(s), comma-separated
+    allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "content-encoding", "authorization"],
+    max_age=3600,
 )
 
+# Compress larger responses (player lists, recommendation payloads) for clients that
+# accept gzip; level 5 keeps most of the size win at a fraction of level 9's CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files (for serving the HTML frontend)
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 # Initialize ML model
 ml_model = DraftMLModel()
 
+# Recommendations are deterministic in the request, so repeated polls (refreshes,
+# sibling tabs) are served from pre-serialized bytes. Entries expire after 30s, and
+# each worker clears its cache when it starts serving a retrained model.
+RECOMMENDATION_CACHE_TTL = 30
+recommendation_cache = TTLCache(maxsize=1024, ttl=RECOMMENDATION_CACHE_TTL)
+recommendation_cache_lock = threading.Lock()
+
+
+# Response sections selectable via ?include=. Recommendations are always returned, so
+# include=recommendations on its own skips every optional insight section.
+ResponseSection = Literal[
+    "recommendations", "strategy", "insights", "next_round_focus", "risk_assessment"
+]
+INSIGHT_SECTIONS = ("strategy", "insights", "next_round_focus", "risk_assessment")
+
+
+def recommendation_cache_key(request: DraftRequest, sections) -> str:
+    """Stable digest of everything that influences a recommendation response"""
+    return hashlib.blake2b(
+        orjson.dumps(
+            [
+                request.available_players,
+                request.drafted_players,
+                request.current_roster,
+                request.current_round,
+                request.draft_slot,
+                request.teams,
+                request.roster_counts,
+                sorted(sections),
+            ]
+        ),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _body_validation_error(e: ValidationError) -> RequestValidationError:
+    return RequestValidationError(
+        [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+    )
+
+
+async def _request_body(raw: Request) -> bytes:
+    """Raw request body, decompressed when the client sent Content-Encoding: gzip"""
+    body = await raw.body()
+    if raw.headers.get("content-encoding", "").lower() == "gzip":
+        try:
+            return gzip.decompress(body)
+        except (OSError, EOFError, zlib.error):
+            raise HTTPException(status_code=400, detail="Invalid gzip request body")
+    return body
+
+
+async def parse_draft_request(raw: Request) -> DraftRequest:
+    """Validate the request body straight from JSON bytes in pydantic-core
+
+    Skips FastAPI's json.loads + dict validation pass; errors keep FastAPI's 422 shape.
+    """
+    try:
+        return DraftRequest.model_validate_json(await _request_body(raw))
+    except ValidationError as e:
+        raise _body_validation_error(e)
+
+
+DRAFT_REQUEST_LIST = TypeAdapter(List[DraftRequest])
+
+
+async def parse_draft_request_batch(raw: Request) -> List[DraftRequest]:
+    """Validate a JSON array of draft states, like parse_draft_request"""
+    try:
+        return DRAFT_REQUEST_LIST.validate_json(await _request_body(raw))
+    except ValidationError as e:
+        raise _body_validation_error(e)
+
+
+def _inline_schema_refs(schema: dict) -> dict:
+    """Resolve local $defs references so the schema can be embedded in OpenAPI"""
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+def _request_body_openapi(schema: dict) -> dict:
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _inline_schema_refs(schema)}},
+        }
+    }
+
+
+# Request body schemas for the docs, since the parse_* dependencies read the raw body
+DRAFT_REQUEST_OPENAPI = _request_body_openapi(DraftRequest.model_json_schema())
+DRAFT_REQUEST_BATCH_OPENAPI = _request_body_openapi(DRAFT_REQUEST_LIST.json_schema())
+
+
+# Frontend pages never change at runtime, so read them once at startup
+with open("app/frontend/enhanced_draft_assistant.html", "rb") as f:
+    ENHANCED_HTML = f.read()
+with open("app/frontend/fixed_draft_assistant_prepopulated.html", "rb") as f:
+    LEGACY_HTML = f.read()
+
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main HTML file"""
-    with open("app/frontend/enhanced_draft_assistant.html", "r") as f:
-        return HTMLResponse(content=f.read())
+    return HTMLResponse(content=ENHANCED_HTML)
 
 
 @app.get("/draft", response_class=HTMLResponse)
 async def draft_page():
     """Serve the draft assistant page"""
-    with open("app/frontend/enhanced_draft_assistant.html", "r") as f:
-        return HTMLResponse(content=f.read())
+    return HTMLResponse(content=ENHANCED_HTML)
 
 
 @app.get("/legacy", response_class=HTMLResponse)
 async def legacy_page():
     """Serve the legacy draft assistant page"""
-    with open("app/frontend/fixed_draft_assistant_prepopulated.html", "r") as f:
-        return HTMLResponse(content=f.read())
+    return HTMLResponse(content=LEGACY_HTML)
+
+
+def recommendation_body(request: DraftRequest, sections) -> bytes:
+    """Serialized recommendation response for one draft state, cached by request"""
+    # Another worker may have finished a retrain; bodies cached here used the old model
+    if ml_model.reload_if_changed():
+        clear_recommendation_cache()
+
+    cache_key = recommendation_cache_key(request, sections)
+    with recommendation_cache_lock:
+        cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Players are already parsed into Player objects by request validation; without an
+    # explicit list, everything on the sample board that hasn't been drafted is available
+    available_players = request.available_players
+    if available_players is None:
+        available_players = ml_model.get_available_board_players(
+            frozenset(request.drafted_players)
+        )
+    current_roster = request.current_roster
+
+    # Debug logging (guarded so the hot path skips the formatting entirely)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Received request - Round %s, Draft Slot %s, %d available, %d on roster",
+            request.current_round,
+            request.draft_slot,
+            len(available_players),
+            len(current_roster),
+        )
 
+    # Use the client's roster counts, or count positions on the roster if not provided
+    counts = request.roster_counts
+    if counts is None:
+        counts = Counter(player.position for player in current_roster)
+    roster_counts = RosterCounts(
+        QB=counts.get("QB", 0),
+        RB=counts.get("RB", 0),
+        WR=counts.get("WR", 0),
+        TE=counts.get("TE", 0),
+        K=counts.get("K", 0),
+        DST=counts.get("DST", 0),
+    )
+
+    # Calculate flex and bench counts
+    roster_counts.FLEX = roster_counts.get_flex_eligible()
+    roster_counts.BENCH = roster_counts.get_bench_used()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Roster counts: %s", roster_counts)
+
+    # Use ML model to get enhanced recommendations
+    recommendations = ml_model.get_recommendations(
+        available_players=available_players,
+        current_roster=current_roster,
+        current_round=request.current_round,
+        draft_slot=request.draft_slot,
+        teams=request.teams,
+        roster_counts=roster_counts,  # Pass roster counts to ML model
+    )
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ML model returned %d recommendations", len(recommendations))
+
+    # Convert recommendations to dictionaries for JSON response
+    final_recommendations = []
+    for rec in recommendations:
+        final_recommendations.append(
+            {
+                "player": {
+                    "name": rec.player.name,
+                    "position": rec.player.position,
+                    "team": rec.player.team,
+                    "adp": rec.player.adp,
+                    "tier": rec.player.tier,
+                },
+                "score": rec.score,
+                "reasoning": rec.reasoning,
+                "priority": rec.priority,
+                "confidence": rec.confidence,
+                "risk_factor": rec.risk_factor,
+                "upside_potential": rec.upside_potential,
+                "ml_score": rec.ml_score,
+                "need_score": rec.need_score,
+                "risk_score": rec.risk_score,
+                "handcuff_score": rec.handcuff_score,
+                "round_score": rec.round_score,
+            }
+        )
 
-@app.post("/api/recommend", response_model=DraftResponse)
-async def get_recommendations(request: DraftRequest, db: Session = Depends(get_db)):
+    # Build the payload directly; DraftResponse is kept for the OpenAPI schema.
+    # Insight sections are only computed when the client asked for them.
+    payload = {"recommendations": final_recommendations}
+    if "strategy" in sections:
+        payload["strategy"] = ml_model.get_strategy_insights(
+            request.current_round, roster_counts
+        )
+    if "insights" in sections:
+        payload["insights"] = ml_model.get_draft_insights(
+            available_players, roster_counts
+        )
+    if "next_round_focus" in sections:
+        payload["next_round_focus"] = ml_model.get_next_round_focus(
+            request.current_round, roster_counts
+        )
+    if "risk_assessment" in sections:
+        payload["risk_assessment"] = ml_model.get_risk_assessment(
+            available_players, roster_counts
+        )
+
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    with recommendation_cache_lock:
+        recommendation_cache[cache_key] = body
+    return body
+
+
+def _include_sections(include: Optional[List[ResponseSection]]):
+    """Insight sections to compute for an ?include= selection"""
+    return INSIGHT_SECTIONS if include is None else frozenset(include) - {"recommendations"}
+
+
+@app.post(
+    "/api/recommend",
+    response_class=ORJSONResponse,
+    responses={200: {"model": DraftResponse}},
+    openapi_extra=DRAFT_REQUEST_OPENAPI,
+)
+def get_recommendations(
+    request: DraftRequest = Depends(parse_draft_request),
+    include: Optional[List[ResponseSection]] = Query(
+        None,
+        description="Insight sections to compute alongside the recommendations "
+        "(default: all; include=recommendations alone returns only recommendations)",
+    ),
+):
     """
     Get ML-enhanced draft recommendations based on current roster and draft state
+
+    Declared sync so FastAPI runs the CPU-bound scoring in its threadpool instead
+    of blocking the event loop.
     """
     try:
-        # Debug logging
-        print(
-            f"🔍 DEBUG: Received request - Round {request.current_round}, Draft Slot {request.draft_slot}"
-        )
-        print(f"🔍 DEBUG: Available players count: {len(request.available_players)}")
-        print(f"🔍 DEBUG: Current roster count: {len(request.current_roster)}")
-        print(
-            f"🔍 DEBUG: First few available players: {[p['name'] for p in request.available_players[:5]]}"
-        )
-        print(
-            f"🔍 DEBUG: First few roster players: {[p['name'] for p in request.current_roster[:5]]}"
-        )
+        body = recommendation_body(request, _include_sections(include))
+        return Response(content=body, media_type="application/json")
 
-        # Convert dictionaries to Player objects
-        from app.models.models import Player, RosterCounts
-
-        available_players = [
-            Player(
-                name=p["name"],
-                position=p["position"],
-                team=p["team"],
-                adp=p["adp"],
-                tier=p["tier"],
-            )
-            for p in request.available_players
-        ]
-
-        current_roster = [
-            Player(
-                name=p["name"],
-                position=p["position"],
-                team=p["team"],
-                adp=p["adp"],
-                tier=p["tier"],
-            )
-            for p in request.current_roster
-        ]
-
-        print(f"🔍 DEBUG: Converted available players count: {len(available_players)}")
-        print(f"🔍 DEBUG: Converted roster players count: {len(current_roster)}")
-        print(
-            f"🔍 DEBUG: Available player names: {[p.name for p in available_players[:5]]}"
-        )
-        print(f"🔍 DEBUG: Roster player names: {[p.name for p in current_roster[:5]]}")
-
-        # Create roster counts if not provided
-        if request.roster_counts is None:
-            roster_counts = RosterCounts()
-            for player in current_roster:
-                if player.position == "QB":
-                    roster_counts.QB += 1
-                elif player.position == "RB":
-                    roster_counts.RB += 1
-                elif player.position == "WR":
-                    roster_counts.WR += 1
-                elif player.position == "TE":
-                    roster_counts.TE += 1
-                elif player.position == "K":
-                    roster_counts.K += 1
-                elif player.position == "DST":
-                    roster_counts.DST += 1
-
-            # Calculate flex and bench counts
-            roster_counts.FLEX = roster_counts.get_flex_eligible()
-            roster_counts.BENCH = roster_counts.get_bench_used()
-        else:
-            # Convert dict to RosterCounts object
-            roster_counts = RosterCounts(
-                QB=request.roster_counts.get("QB", 0),
-                RB=request.roster_counts.get("RB", 0),
-                WR=request.roster_counts.get("WR", 0),
-                TE=request.roster_counts.get("TE", 0),
-                K=request.roster_counts.get("K", 0),
-                DST=request.roster_counts.get("DST", 0),
-            )
-            # Calculate flex and bench counts
-            roster_counts.FLEX = roster_counts.get_flex_eligible()
-            roster_counts.BENCH = roster_counts.get_bench_used()
-
-        print(
-            f"🔍 DEBUG: Roster counts - QB: {roster_counts.QB}, RB: {roster_counts.RB}, WR: {roster_counts.WR}, TE: {roster_counts.TE}, K: {roster_counts.K}, DST: {roster_counts.DST}"
+    except Exception as e:
+        logger.exception("Error in get_recommendations")
+        raise HTTPException(
+            status_code=500, detail=f"Error generating recommendations: {str(e)}"
         )
 
-        # Use ML model to get enhanced recommendations
-        recommendations = ml_model.get_recommendations(
-            available_players=available_players,
-            current_roster=current_roster,
-            current_round=request.current_round,
-            draft_slot=request.draft_slot,
-            teams=request.teams,
-            roster_counts=roster_counts,  # Pass roster counts to ML model
-        )
 
-        print(f"🔍 DEBUG: ML model returned {len(recommendations)} recommendations")
-
-        # Convert recommendations to dictionaries for JSON response
-        final_recommendations = []
-        for rec in recommendations:
-            final_recommendations.append(
-                {
-                    "player": {
-                        "name": rec.player.name,
-                        "position": rec.player.position,
-                        "team": rec.player.team,
-                        "adp": rec.player.adp,
-                        "tier": rec.player.tier,
-                    },
-                    "score": rec.score,
-                    "reasoning": rec.reasoning,
-                    "priority": rec.priority,
-                    "confidence": rec.confidence,
-                    "risk_factor": rec.risk_factor,
-                    "upside_potential": rec.upside_potential,
-                    "ml_score": rec.ml_score,
-                    "need_score": rec.need_score,
-                    "risk_score": rec.risk_score,
-                    "handcuff_score": rec.handcuff_score,
-                    "round_score": rec.round_score,
-                }
-            )
-
-        return DraftResponse(
-            recommendations=final_recommendations,
-            strategy=ml_model.get_strategy_insights(
-                request.current_round, roster_counts
-            ),
-            insights=ml_model.get_draft_insights(available_players, roster_counts),
-            next_round_focus=ml_model.get_next_round_focus(
-                request.current_round, roster_counts
-            ),
-            risk_assessment=ml_model.get_risk_assessment(
-                available_players, roster_counts
-            ),
-        )
+@app.post(
+    "/api/recommend/batch",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[DraftResponse]}},
+    openapi_extra=DRAFT_REQUEST_BATCH_OPENAPI,
+)
+def get_batch_recommendations(
+    states: List[DraftRequest] = Depends(parse_draft_request_batch),
+    include: Optional[List[ResponseSection]] = Query(
+        None,
+        description="Insight sections to compute alongside each set of "
+        "recommendations (default: all; include=recommendations alone returns "
+        "only recommendations)",
+    ),
+):
+    """
+    Get recommendations for several independent draft states in one round trip
+
+    Responses are returned in request order; each one is cached like /api/recommend.
+    """
+    try:
+        sections = _include_sections(include)
+        bodies = [recommendation_body(state, sections) for state in states]
+        return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
 
     except Exception as e:
-        print(f"🔍 DEBUG: Error in get_recommendations: {str(e)}")
+        logger.exception("Error in get_batch_recommendations")
         raise HTTPException(
             status_code=500, detail=f"Error generating recommendations: {str(e)}"
         )
 
 
 @app.post("/api/analyze-player")
-async def analyze_player(player: dict, db: Session = Depends(get_db)):
+def analyze_player(player: dict):
     """
     Analyze a specific player using ML models
     """
@@ -210,7 +391,7 @@ async def analyze_player(player: dict, db: Session = Depends(get_db)):
 
 
 @app.get("/api/players")
-async def get_players(db: Session = Depends(get_db)):
+async def get_players():
     """
     Get all available players
     """
@@ -222,19 +403,46 @@ async def get_players(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Error fetching players: {str(e)}")
 
 
-@app.post("/api/update-model")
-async def update_model(db: Session = Depends(get_db)):
+def clear_recommendation_cache():
+    with recommendation_cache_lock:
+        recommendation_cache.clear()
+
+
+@app.post("/api/update-model", status_code=202)
+def update_model():
     """
-    Retrain the ML model with new data
+    Queue a background refit of the ML model; poll /api/update-model/{job_id}
     """
     try:
-        ml_model.retrain_model()
-        return {"message": "Model updated successfully"}
+        return ml_model.retrain_model(on_complete=clear_recommendation_cache)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating model: {str(e)}")
 
 
+@app.get("/api/update-model/{job_id}")
+def get_update_model_status(job_id: str):
+    """
+    Get the status of a queued model retrain
+    """
+    status = ml_model.get_retrain_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Unknown retrain job: {job_id}")
+    return status
+
+
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("ENVIRONMENT") == "development":
+        # Single auto-reloading process for local development
+        uvicorn.run("app.api.main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # Recommendations are CPU-bound, so scale with worker processes
+        uvicorn.run(
+            "app.api.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=os.cpu_count() or 1,
+        )
@@ -1,7 +1,32 @@
+from collections import Counter
+from functools import lru_cache
 from typing import List, Dict, Any
 from app.models.models import Recommendation, Player, RosterCounts
 import logging
 
+import numpy as np
+
+# Integer position codes used by the vectorized strategy pass
+POSITIONS = ('QB', 'RB', 'WR', 'TE', 'K', 'DST')
+POSITION_IDS = {pos: i for i, pos in enumerate(POSITIONS)}
+UNKNOWN_POSITION_ID = len(POSITIONS)
+
+
+@lru_cache(maxsize=4096)
+def _need_score(position: str, qb: int, rb: int, wr: int, te: int, k: int, dst: int, current_round: int) -> float:
+    """Need score for a position given roster counts; memoized since the key space is tiny"""
+    base_scores = {
+        'QB': 100 if qb < 1 else 30,
+        'RB': 100 if rb < 2 else 60 if rb < 4 else 20,
+        'WR': 100 if wr < 2 else 60 if wr < 4 else 20,
+        'TE': 100 if te < 1 else 50 if te < 2 else 15,
+        'K': 100 if k < 1 and current_round >= 12 else 0,
+        'DST': 100 if dst < 1 and current_round >= 12 else 0
+    }
+    
+    return base_scores.get(position, 0)
+
+
 class DraftLogic:
     """Applies strategic draft rules and constraints to ML recommendations"""
     
@@ -23,6 +48,12 @@ class DraftLogic:
             'late_mid': {'rounds': [8, 9, 10, 11], 'focus': 'depth'},
             'late': {'rounds': [12, 13, 14, 15, 16], 'focus': 'needs'}
         }
+        
+        # Flattened round -> focus lookup so get_round_strategy is a single dict hit
+        self._round_strategy = {}
+        for strategy_info in self.round_strategies.values():
+            for round_num in strategy_info['rounds']:
+                self._round_strategy.setdefault(round_num, strategy_info['focus'])
     
     def apply_draft_strategy(
         self,
@@ -35,55 +66,183 @@ class DraftLogic:
         # Get current round strategy
         strategy = self.get_round_strategy(current_round)
         
-        # Apply position scarcity adjustments
-        adjusted_recommendations = self.apply_position_scarcity(recommendations)
+        if not recommendations:
+            return recommendations
         
-        # Apply roster balance rules
-        adjusted_recommendations = self.apply_roster_balance(
-            adjusted_recommendations, roster_counts, current_round
-        )
+        # Pack the per-recommendation fields into parallel arrays
+        scores, adps, pos_ids = self._vectorize(recommendations)
+        is_k_dst = (pos_ids == POSITION_IDS['K']) | (pos_ids == POSITION_IDS['DST'])
         
-        # Apply round-specific constraints
-        adjusted_recommendations = self.apply_round_constraints(
-            adjusted_recommendations, current_round, strategy
-        )
+        # Position scarcity: bonus by how many players remain at each position
+        remaining = np.bincount(pos_ids, minlength=len(POSITIONS) + 1)[pos_ids]
+        scores += np.select([remaining < 5, remaining < 10, remaining < 15], [30, 20, 10], 0)
         
-        # Apply value vs. need balance
-        adjusted_recommendations = self.apply_value_need_balance(
-            adjusted_recommendations, current_round, roster_counts
+        # Roster balance only depends on position, so build a per-position table
+        balance_table = np.array(
+            [self._balance_delta(pos, roster_counts, current_round) for pos in POSITIONS] + [0],
+            dtype=np.float64
         )
+        scores += balance_table[pos_ids]
+        
+        # Round-specific constraints, accumulated in place with masked adds
+        delta = np.zeros_like(scores)
+        if current_round <= 5:
+            delta[is_k_dst] -= 100
+        elif 6 <= current_round <= 10:
+            delta[is_k_dst] -= 50
+            delta[~is_k_dst & (adps > 100)] -= 20
+        elif current_round >= 11:
+            delta[is_k_dst & (scores > 0)] += 30
+        
+        if strategy == 'best_available':
+            if current_round <= 3:
+                delta[adps <= 30] += 25
+        elif strategy == 'needs':
+            delta[scores + delta > 100] += 15
+        scores += delta
+        
+        # Value vs. need blend based on draft stage
+        if current_round <= 3:
+            scores *= 0.7
+            scores += (200 - adps) * 0.3
+        else:
+            need_table = np.array(
+                [self.calculate_need_score(pos, roster_counts, current_round) for pos in POSITIONS] + [0],
+                dtype=np.float64
+            )
+            need_weight = 0.2 if current_round <= 7 else 0.4
+            scores *= 1 - need_weight
+            scores += need_table[pos_ids] * need_weight
+        
+        # Write back and re-sort by final adjusted scores (stable, highest first)
+        for rec, score in zip(recommendations, scores.tolist()):
+            rec.score = score
+        order = np.argsort(-scores, kind='stable')
+        recommendations[:] = [recommendations[i] for i in order]
         
-        # Re-sort by final adjusted scores
-        adjusted_recommendations.sort(key=lambda x: x.score, reverse=True)
-        
-        return adjusted_recommendations
+        return recommendations
+    
+    def _vectorize(self, recommendations: List[Recommendation]):
+        """Pack recommendations into (scores, adps, position ids) arrays"""
+        n = len(recommendations)
+        players = [rec.player for rec in recommendations]
+        scores = np.fromiter((rec.score for rec in recommendations), dtype=np.float64, count=n)
+        adps = np.fromiter((player.adp for player in players), dtype=np.float64, count=n)
+        pos_ids = np.fromiter(
+            (POSITION_IDS.get(player.position, UNKNOWN_POSITION_ID) for player in players),
+            dtype=np.int8,
+            count=n
+        )
+        return scores, adps, pos_ids
     
     def get_round_strategy(self, current_round: int) -> str:
         """Determine strategy for current round"""
-        for strategy_name, strategy_info in self.round_strategies.items():
-            if current_round in strategy_info['rounds']:
-                return strategy_info['focus']
-        return 'balanced'
+        return self._round_strategy.get(current_round, 'balanced')
+    
+    def _scarcity_delta(self, count: int) -> float:
+        """Score bonus for a position with `count` players still available"""
+        if count < 5:  # Very scarce
+            return 30
+        elif count < 10:  # Scarce
+            return 20
+        elif count < 15:  # Moderately scarce
+            return 10
+        return 0
+    
+    def _balance_delta(self, pos: str, roster_counts: RosterCounts, current_round: int) -> float:
+        """Score bonus from roster balance rules"""
+        # Critical needs (must have starters)
+        if pos == 'RB' and roster_counts.RB < 2:
+            return 40
+        elif pos == 'WR' and roster_counts.WR < 2:
+            return 40
+        elif pos == 'TE' and roster_counts.TE < 1:
+            return 35
+        elif pos == 'QB' and roster_counts.QB < 1:
+            return 30
+        
+        # Depth needs
+        elif pos == 'RB' and roster_counts.RB < 4:
+            return 20
+        elif pos == 'WR' and roster_counts.WR < 4:
+            return 20
+        elif pos == 'TE' and roster_counts.TE < 2:
+            return 15
+        
+        # Late round K/DST priority
+        elif current_round >= 12:
+            if pos == 'K' and roster_counts.K < 1:
+                return 50
+            elif pos == 'DST' and roster_counts.DST < 1:
+                return 50
+        return 0
+    
+    def _round_constraint_delta(
+        self,
+        pos: str,
+        adp: int,
+        score: float,
+        current_round: int,
+        strategy: str
+    ) -> float:
+        """Score adjustment from round-specific constraints given the running score"""
+        delta = 0
+        
+        # Early rounds: avoid K/DST
+        if current_round <= 5 and pos in ['K', 'DST']:
+            delta -= 100
+        
+        # Mid rounds: balance value and need
+        elif 6 <= current_round <= 10:
+            if pos in ['K', 'DST']:
+                delta -= 50
+            elif adp > 100:  # Avoid reaches
+                delta -= 20
+        
+        # Late rounds: prioritize needs
+        elif current_round >= 11:
+            if pos in ['K', 'DST'] and score > 0:
+                delta += 30  # Boost K/DST in late rounds
+        
+        # Strategy-specific adjustments
+        if strategy == 'best_available':
+            # Boost high-ADP players in early rounds
+            if current_round <= 3 and adp <= 30:
+                delta += 25
+        elif strategy == 'needs':
+            # Boost players that fill critical needs
+            if score + delta > 100:  # Already a good recommendation
+                delta += 15
+        
+        return delta
+    
+    def _value_need_blend(
+        self,
+        score: float,
+        player: Player,
+        roster_counts: RosterCounts,
+        current_round: int
+    ) -> float:
+        """Blend a score with value or need depending on draft stage"""
+        # Adjust based on round
+        if current_round <= 3:
+            # Early rounds: favor value over need
+            value_score = 200 - player.adp  # Higher ADP = lower value
+            return score * 0.7 + value_score * 0.3
+        
+        need_score = self.calculate_need_score(player.position, roster_counts, current_round)
+        if current_round <= 7:
+            # Mid rounds: balance value and need
+            return score * 0.8 + need_score * 0.2
+        # Late rounds: favor need over value
+        return score * 0.6 + need_score * 0.4
     
     def apply_position_scarcity(self, recommendations: List[Recommendation]) -> List[Recommendation]:
         """Adjust scores based on position scarcity"""
-        # Count available players by position
-        position_counts = {}
-        for rec in recommendations:
-            pos = rec.player.position
-            position_counts[pos] = position_counts.get(pos, 0) + 1
+        position_counts = Counter(rec.player.position for rec in recommendations)
         
-        # Apply scarcity bonuses
         for rec in recommendations:
-            pos = rec.player.position
-            count = position_counts.get(pos, 0)
-            
-            if count < 5:  # Very scarce
-                rec.score += 30
-            elif count < 10:  # Scarce
-                rec.score += 20
-            elif count < 15:  # Moderately scarce
-                rec.score += 10
+            rec.score += self._scarcity_delta(position_counts[rec.player.position])
         
         return recommendations
     
@@ -96,32 +255,7 @@ class DraftLogic:
         """Apply roster balance rules"""
         
         for rec in recommendations:
-            pos = rec.player.position
-            
-            # Critical needs (must have starters)
-            if pos == 'RB' and roster_counts.RB < 2:
-                rec.score += 40
-            elif pos == 'WR' and roster_counts.WR < 2:
-                rec.score += 40
-            elif pos == 'TE' and roster_counts.TE < 1:
-                rec.score += 35
-            elif pos == 'QB' and roster_counts.QB < 1:
-                rec.score += 30
-            
-            # Depth needs
-            elif pos == 'RB' and roster_counts.RB < 4:
-                rec.score += 20
-            elif pos == 'WR' and roster_counts.WR < 4:
-                rec.score += 20
-            elif pos == 'TE' and roster_counts.TE < 2:
-                rec.score += 15
-            
-            # Late round K/DST priority
-            elif current_round >= 12:
-                if pos == 'K' and roster_counts.K < 1:
-                    rec.score += 50
-                elif pos == 'DST' and roster_counts.DST < 1:
-                    rec.score += 50
+            rec.score += self._balance_delta(rec.player.position, roster_counts, current_round)
         
         return recommendations
     
@@ -134,33 +268,10 @@ class DraftLogic:
         """Apply round-specific constraints"""
         
         for rec in recommendations:
-            pos = rec.player.position
-            
-            # Early rounds: avoid K/DST
-            if current_round <= 5 and pos in ['K', 'DST']:
-                rec.score -= 100
-            
-            # Mid rounds: balance value and need
-            elif 6 <= current_round <= 10:
-                if pos in ['K', 'DST']:
-                    rec.score -= 50
-                elif rec.player.adp > 100:  # Avoid reaches
-                    rec.score -= 20
-            
-            # Late rounds: prioritize needs
-            elif current_round >= 11:
-                if pos in ['K', 'DST'] and rec.score > 0:
-                    rec.score += 30  # Boost K/DST in late rounds
-            
-            # Strategy-specific adjustments
-            if strategy == 'best_available':
-                # Boost high-ADP players in early rounds
-                if current_round <= 3 and rec.player.adp <= 30:
-                    rec.score += 25
-            elif strategy == 'needs':
-                # Boost players that fill critical needs
-                if rec.score > 100:  # Already a good recommendation
-                    rec.score += 15
+            player = rec.player
+            rec.score += self._round_constraint_delta(
+                player.position, player.adp, rec.score, current_round, strategy
+            )
         
         return recommendations
     
@@ -173,49 +284,37 @@ class DraftLogic:
         """Balance value vs. need based on draft stage"""
         
         for rec in recommendations:
-            # Calculate value vs. need balance
-            value_score = 200 - rec.player.adp  # Higher ADP = lower value
-            need_score = self.calculate_need_score(rec.player.position, roster_counts, current_round)
-            
-            # Adjust based on round
-            if current_round <= 3:
-                # Early rounds: favor value over need
-                rec.score = rec.score * 0.7 + value_score * 0.3
-            elif current_round <= 7:
-                # Mid rounds: balance value and need
-                rec.score = rec.score * 0.8 + need_score * 0.2
-            else:
-                # Late rounds: favor need over value
-                rec.score = rec.score * 0.6 + need_score * 0.4
+            rec.score = self._value_need_blend(rec.score, rec.player, roster_counts, current_round)
         
         return recommendations
     
     def calculate_need_score(self, position: str, roster_counts: RosterCounts, current_round: int) -> float:
         """Calculate how much we need a specific position"""
-        base_scores = {
-            'QB': 100 if roster_counts.QB < 1 else 30,
-            'RB': 100 if roster_counts.RB < 2 else 60 if roster_counts.RB < 4 else 20,
-            'WR': 100 if roster_counts.WR < 2 else 60 if roster_counts.WR < 4 else 20,
-            'TE': 100 if roster_counts.TE < 1 else 50 if roster_counts.TE < 2 else 15,
-            'K': 100 if roster_counts.K < 1 and current_round >= 12 else 0,
-            'DST': 100 if roster_counts.DST < 1 and current_round >= 12 else 0
-        }
-        
-        return base_scores.get(position, 0)
+        return _need_score(
+            position,
+            roster_counts.QB,
+            roster_counts.RB,
+            roster_counts.WR,
+            roster_counts.TE,
+            roster_counts.K,
+            roster_counts.DST,
+            current_round
+        )
     
     def validate_recommendation(self, rec: Recommendation, current_round: int) -> bool:
         """Validate if a recommendation makes sense for the current round"""
+        player = rec.player
         
         # Early rounds: no K/DST
-        if current_round <= 5 and rec.player.position in ['K', 'DST']:
+        if current_round <= 5 and player.position in ['K', 'DST']:
             return False
         
         # Check for obvious reaches
-        if rec.player.adp > 150 and current_round <= 8:
+        if player.adp > 150 and current_round <= 8:
             return False
         
         # Check for obvious steals
-        if rec.player.adp <= 20 and current_round >= 10:
+        if player.adp <= 20 and current_round >= 10:
             return False
         
         return True
@@ -262,32 +361,28 @@ class DraftLogic:
     def apply_handcuff_logic(self, recommendations: List[Recommendation], current_roster: List[Player]) -> List[Recommendation]:
         """Apply handcuff logic for RBs"""
         
-        # Get RBs on current roster
-        my_rbs = [p for p in current_roster if p.position == 'RB']
+        # Teams of RBs on current roster
+        my_rb_teams = frozenset(p.team for p in current_roster if p.position == 'RB')
         
         for rec in recommendations:
-            if rec.player.position == 'RB':
-                # Check if this is a handcuff
-                for my_rb in my_rbs:
-                    if my_rb.team == rec.player.team:
-                        rec.score += 25  # Handcuff bonus
-                        rec.reasoning.append("Handcuff")
-                        break
+            player = rec.player
+            # Check if this is a handcuff
+            if player.position == 'RB' and player.team in my_rb_teams:
+                rec.score += 25  # Handcuff bonus
+                rec.reasoning.append("Handcuff")
         
         return recommendations
     
     def apply_bye_week_logic(self, recommendations: List[Recommendation], current_roster: List[Player]) -> List[Recommendation]:
         """Apply bye week logic to avoid conflicts"""
         
-        # Get bye weeks of current roster
-        bye_weeks = [p.bye_week for p in current_roster if p.bye_week]
+        # Count bye weeks of current roster
+        bye_counts = Counter(p.bye_week for p in current_roster if p.bye_week)
         
         for rec in recommendations:
-            if rec.player.bye_week and rec.player.bye_week in bye_weeks:
-                # Penalize players with same bye week as multiple starters
-                bye_count = bye_weeks.count(rec.player.bye_week)
-                if bye_count >= 2:
-                    rec.score -= 15
-                    rec.reasoning.append("Bye week conflict")
+            # Penalize players with same bye week as multiple starters
+            if bye_counts.get(rec.player.bye_week, 0) >= 2:
+                rec.score -= 15
+                rec.reasoning.append("Bye week conflict")
         
         return recommendations
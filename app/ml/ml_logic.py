@@ -1,136 +1,461 @@
+import csv
+import logging
+import multiprocessing
 import os
-from typing import Any, Dict, List
+import pickle
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.preprocessing import LabelEncoder, StandardScaler
 
-from app.models.models import Player, Recommendation, RosterCounts
+from app.models.models import Player, Recommendation, RosterCounts, SamplePlayer
+
+logger = logging.getLogger(__name__)
+
+# Trained model artifact, shared by the save and load paths
+MODEL_PATH = os.getenv("MODEL_PATH", "models/draft_models.joblib")
+
+# Retrain job statuses, one small file per job, so every worker process can answer polls
+RETRAIN_STATUS_DIR = os.path.join(os.path.dirname(MODEL_PATH) or ".", "retrain_jobs")
+
+# Seconds between checks for an artifact written by another worker process's retrain
+MODEL_RELOAD_INTERVAL = float(os.getenv("MODEL_RELOAD_INTERVAL", "1.0"))
+
+# Bump when the features or training setup change so stale artifacts get retrained
+MODEL_VERSION = 5
+
+# Sample player board shipped with the package
+SAMPLE_PLAYERS_PATH = os.path.join(os.path.dirname(__file__), "data", "sample_players.csv")
+
+# Feature columns used to train and query the per-position models
+FEATURE_COLUMNS = ["adp", "tier_encoded", "age", "experience", "strength_of_schedule"]
+
+# Integer position codes; per-position tables carry one extra slot for unknown positions
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+POSITION_CODES = {pos: i for i, pos in enumerate(POSITIONS)}
+UNKNOWN_POSITION_CODE = len(POSITIONS)
+
+# Position-specific adjustments for the fallback value score, indexed by position code
+POSITION_VALUE_MULTIPLIER = np.array(
+    [
+        0.9,  # QBs get slight penalty in early rounds
+        1.0,  # RBs are baseline
+        1.0,  # WRs are baseline
+        0.95,  # TEs get slight penalty
+        0.3,  # Kickers heavily penalized early
+        0.3,  # DSTs heavily penalized early
+        1.0,  # Unknown positions are unadjusted
+    ]
+)
+
+# Highest ADP in each sample board tier; tiers are 1-based and anything past the last cut is tier 6
+TIER_ADP_CUTS = np.array([10, 22, 50, 80, 120, 160])
+
+
+def _adp_tiers(adp: np.ndarray) -> np.ndarray:
+    """Sample board tier for each ADP"""
+    return np.minimum(np.searchsorted(TIER_ADP_CUTS, adp) + 1, len(TIER_ADP_CUTS))
+
+
+@lru_cache(maxsize=1)
+def _load_sample_players() -> Tuple[SamplePlayer, ...]:
+    """Unique sample players, read once per process
+
+    Repeated (name, team) rows in the CSV keep their first occurrence.
+    """
+    with open(SAMPLE_PLAYERS_PATH, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    adps = [int(row["adp"]) for row in rows]
+    tiers = _adp_tiers(np.array(adps))
+
+    players: Dict[Tuple[str, str], SamplePlayer] = {}
+    for row, adp, tier in zip(rows, adps, tiers.tolist()):
+        key = (row["name"], row["team"])
+        if key not in players:
+            players[key] = SamplePlayer(
+                name=row["name"], position=row["position"], team=row["team"], adp=adp, tier=str(tier)
+            )
+    return tuple(players.values())
+
+
+@lru_cache(maxsize=1)
+def _load_board_players() -> Tuple[Player, ...]:
+    """Sample players as scoring-ready Player objects, built once per process"""
+    return tuple(
+        Player(name=p.name, position=p.position, team=p.team, adp=p.adp, tier=p.tier)
+        for p in _load_sample_players()
+    )
+
+
+def _artifact_stamp() -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime, size) of the model artifact, or None when there is none on disk"""
+    try:
+        stat = os.stat(MODEL_PATH)
+    except FileNotFoundError:
+        return None
+    # Saves rename a fresh file into place, so the inode changes even within one mtime tick
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _replace_file(path: str, write: Callable[[str], None]):
+    """Write to a temp file and rename it over path, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _retrain_status_path(job_id: str) -> str:
+    return os.path.join(RETRAIN_STATUS_DIR, f"{job_id}.status")
+
+
+def _write_retrain_status(job_id: str, status: str):
+    os.makedirs(RETRAIN_STATUS_DIR, exist_ok=True)
+
+    def write(tmp_path: str):
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(status)
+
+    _replace_file(_retrain_status_path(job_id), write)
+
+
+def _parse_tier(tier) -> float:
+    """Numeric tier, or NaN when the tier isn't a whole number"""
+    if isinstance(tier, int):
+        return tier
+    if isinstance(tier, str) and tier.strip().isdecimal():
+        return int(tier)
+    return np.nan
+
+
+def _players_to_soa(players: List[Player]) -> Dict[str, np.ndarray]:
+    """Unpack players into parallel column arrays (missing optional stats become NaN)"""
+    n = len(players)
+
+    def column(values, dtype=np.float64):
+        return np.fromiter(values, dtype=dtype, count=n)
+
+    return {
+        "adp": column(p.adp for p in players),
+        "tier": column(_parse_tier(p.tier) for p in players),
+        "pos_idx": column(
+            (POSITION_CODES.get(p.position, UNKNOWN_POSITION_CODE) for p in players), np.int8
+        ),
+        "team": np.array([p.team for p in players], dtype=object),
+        "age": column(np.nan if p.age is None else p.age for p in players),
+        "experience": column(np.nan if p.experience is None else p.experience for p in players),
+        "sos": column(
+            np.nan if p.strength_of_schedule is None else p.strength_of_schedule for p in players
+        ),
+    }
+
+
+def _or_default(values: np.ndarray, default: float) -> np.ndarray:
+    """Vectorized `value or default` for a column with NaN for missing values"""
+    return np.where(np.isnan(values) | (values == 0), default, values)
+
+
+def _total_scores(
+    ml_scores: np.ndarray,
+    need_scores: np.ndarray,
+    risk_scores: np.ndarray,
+    handcuff_scores: np.ndarray,
+    round_scores: np.ndarray,
+    is_critical: np.ndarray,
+    adp: np.ndarray,
+    current_round: int,
+) -> np.ndarray:
+    """Weighted total score, accumulated in place into a single output array"""
+    # Combine all scores with MUCH higher need weight
+    total = ml_scores * 0.4  # ML score (40% - reduced from 80%)
+    total += need_scores * 0.4  # Positional need (40% - increased from 10%)
+    total += risk_scores * 0.1  # Risk assessment (10% - increased from 5%)
+    total += handcuff_scores * 0.05  # Handcuff value (5% - increased from 3%)
+    total += round_scores * 0.05  # Round adjustments (5% - increased from 2%)
+
+    # Apply roster constraint bonuses - double score for critical needs
+    total[is_critical] *= 2.0
+
+    # Final ADP validation - smarter round-based penalties
+    if current_round <= 3:
+        total[adp > 50] *= 0.6  # Heavy penalty for ADP > 50 in first 3 rounds
+        total[(adp > 30) & (adp <= 50)] *= 0.8  # Moderate penalty for ADP > 30
+    elif current_round <= 5:
+        total[adp > 80] *= 0.7  # Penalty for ADP > 80 in rounds 4-5
+    elif current_round <= 8:
+        total[adp > 120] *= 0.8  # Light penalty for ADP > 120 in rounds 6-8
+
+    return total
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, highest first, ties kept in input order"""
+    if len(scores) > k > 0:
+        # O(N) partition finds the k-th best score; only scores at or above it get sorted
+        kth_best = -np.partition(-scores, k - 1)[k - 1]
+        pool = np.flatnonzero(scores >= kth_best)
+    else:
+        pool = np.arange(len(scores))
+    return pool[np.argsort(-scores[pool], kind="stable")][:k]
+
+
+@lru_cache(maxsize=256)
+def _strategy_insights(
+    current_round: int, critical_needs: Tuple[str, ...], depth_needs: Tuple[str, ...]
+) -> str:
+    """Strategy insight text - a pure function of the round and roster needs"""
+    if current_round <= 3:
+        if critical_needs:
+            return f"🎯 EARLY ROUNDS: CRITICAL NEEDS - Must draft: {', '.join(critical_needs)}"
+        else:
+            return "🎯 EARLY ROUNDS: Focus on best available player"
+    elif current_round <= 7:
+        if critical_needs:
+            return f"🏗️ MID ROUNDS: CRITICAL NEEDS - Must draft: {', '.join(critical_needs)}"
+        elif depth_needs:
+            return f"🏗️ MID ROUNDS: Build depth at: {', '.join(depth_needs)}"
+        else:
+            return "🏗️ MID ROUNDS: Build roster depth and value"
+    elif current_round <= 11:
+        if critical_needs:
+            return f"📈 LATE MID: CRITICAL NEEDS remaining: {', '.join(critical_needs)}"
+        else:
+            return "📈 LATE MID: Focus on depth, value picks, and handcuffs"
+    else:
+        if critical_needs:
+            return f"⏰ LATE ROUNDS: MUST FILL: {', '.join(critical_needs)}"
+        else:
+            return "⏰ LATE ROUNDS: Fill remaining needs and optimize bench"
+
+
+@lru_cache(maxsize=32)
+def _next_round_focus(current_round: int) -> str:
+    """Next-round focus text - depends only on the round"""
+    if current_round <= 3:
+        return "Best available player regardless of position"
+    elif current_round <= 7:
+        return "Balance positional needs with value"
+    elif current_round <= 11:
+        return "Build roster depth and consider handcuffs"
+    else:
+        return "Fill remaining needs and target K/DST"
+
+
+def _train_models_worker() -> Dict[str, Any]:
+    """Train and persist a fresh model in a worker process, returning the artifact"""
+    model = DraftMLModel(load=False)
+    model.train_models()
+    return model._artifact()
 
 
 class DraftMLModel:
-    def __init__(self):
+    def __init__(self, load: bool = True):
         self.scaler = StandardScaler()
         self.position_encoder = LabelEncoder()
         self.team_encoder = LabelEncoder()
         self.tier_encoder = LabelEncoder()
 
-        # Initialize models for different positions
-        self.models = {
-            "RB": RandomForestRegressor(n_estimators=100, random_state=42),
-            "WR": RandomForestRegressor(n_estimators=100, random_state=42),
-            "TE": RandomForestRegressor(n_estimators=100, random_state=42),
-            "QB": RandomForestRegressor(n_estimators=100, random_state=42),
-            "K": RandomForestRegressor(n_estimators=50, random_state=42),
-            "DST": RandomForestRegressor(n_estimators=50, random_state=42),
-        }
+        # One shared model for all positions, with the position one-hot encoded as features
+        self.model = self._build_regressor(max_iter=50, max_depth=6)
 
         self.is_trained = False
-        self.load_or_train_models()
+
+        # Stamp of the artifact this process is serving, to spot retrains by other workers
+        self._loaded_stamp: Optional[Tuple[int, int, int]] = None
+        self._next_reload_check = 0.0
+        self._reload_lock = threading.Lock()
+
+        # Background retraining runs in a single worker process, created on first use
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        if load:
+            self.load_or_train_models()
+
+    @staticmethod
+    def _build_regressor(max_iter: int, max_depth: int) -> HistGradientBoostingRegressor:
+        """Histogram gradient boosting, which bins features once and fits far faster than a forest"""
+        return HistGradientBoostingRegressor(
+            max_iter=max_iter,
+            max_depth=max_depth,
+            max_bins=64,
+            early_stopping=False,
+            random_state=42,
+        )
 
     def load_or_train_models(self):
         """Load pre-trained models or train new ones"""
-        model_path = "models/draft_models.pkl"
-
-        if os.path.exists(model_path):
-            try:
-                self.models = joblib.load(model_path)
-                self.is_trained = True
-                print("Loaded pre-trained models")
-            except:
-                print("Failed to load models, training new ones")
-                self.train_models()
-        else:
+        stamp = _artifact_stamp()
+        artifact = self._read_artifact()
+        if artifact is None:
             self.train_models()
+        else:
+            self._install_artifact(artifact)
+            self._loaded_stamp = stamp
+            logger.info("Loaded pre-trained models from %s", MODEL_PATH)
+
+    def reload_if_changed(self) -> bool:
+        """Install an artifact another process wrote since this one was loaded
+
+        Checks the file at most every MODEL_RELOAD_INTERVAL seconds; returns True
+        when a new model was swapped in.
+        """
+        now = time.monotonic()
+        if now < self._next_reload_check or not self._reload_lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_reload_check = now + MODEL_RELOAD_INTERVAL
+            stamp = _artifact_stamp()
+            if stamp is None or stamp == self._loaded_stamp:
+                return False
+            artifact = self._read_artifact()
+            self._loaded_stamp = stamp
+            if artifact is None:
+                return False
+            self._install_artifact(artifact)
+            logger.info("Reloaded models from %s", MODEL_PATH)
+            return True
+        finally:
+            self._reload_lock.release()
+
+    def _read_artifact(self) -> Optional[Dict[str, Any]]:
+        """Load the persisted artifact, or None when it's missing, unreadable or stale"""
+        if not os.path.exists(MODEL_PATH):
+            return None
+        try:
+            artifact = joblib.load(MODEL_PATH)
+            if artifact["version"] != MODEL_VERSION:
+                raise ValueError(f"model artifact version {artifact['version']!r} is stale")
+            return artifact
+        except (
+            OSError,
+            EOFError,
+            KeyError,
+            AttributeError,
+            TypeError,
+            ValueError,
+            pickle.UnpicklingError,
+        ):
+            logger.warning("Failed to load models from %s", MODEL_PATH, exc_info=True)
+            return None
 
     def train_models(self):
         """Train ML models using historical fantasy data"""
-        print("Training ML models...")
-
         # Generate synthetic training data (in production, use real historical data)
         training_data = self.generate_training_data()
 
-        for position in self.models.keys():
-            pos_data = training_data[training_data["position"] == position]
-            if len(pos_data) > 0:
-                X = pos_data[
-                    ["adp", "tier_encoded", "age", "experience", "strength_of_schedule"]
-                ].fillna(0)
-                y = pos_data["fantasy_points"]
+        logger.info("Training ML models...")
 
-                if len(X) > 10:  # Need minimum data to train
-                    self.models[position].fit(X, y)
+        # Fit the feature scaler once on the full training set
+        self.scaler.fit(training_data[FEATURE_COLUMNS].fillna(0).to_numpy())
+        self._cache_scaler_stats()
 
+        X = self._model_features(
+            training_data[FEATURE_COLUMNS].fillna(0).to_numpy(),
+            training_data["position"].map(POSITION_CODES).to_numpy(),
+        )
+        self.model.fit(X, training_data["fantasy_points"].to_numpy())
         self.is_trained = True
 
         # Save models
-        os.makedirs("models", exist_ok=True)
-        model_path = "models/draft_models.joblib"
-        joblib.dump(self.models, model_path)
-        print("Models trained and saved")
+        os.makedirs(os.path.dirname(MODEL_PATH) or ".", exist_ok=True)
+        _replace_file(MODEL_PATH, lambda tmp_path: joblib.dump(self._artifact(), tmp_path, compress=3))
+        self._loaded_stamp = _artifact_stamp()
+        logger.info("Models trained and saved to %s", MODEL_PATH)
+
+    def _artifact(self) -> Dict[str, Any]:
+        """Everything needed to restore the trained model"""
+        return {
+            "version": MODEL_VERSION,
+            "model": self.model,
+            "scaler": self.scaler,
+        }
+
+    def _install_artifact(self, artifact: Dict[str, Any]):
+        """Swap in a trained model and scaler (from disk or a retrain worker)"""
+        self.scaler = artifact["scaler"]
+        self._cache_scaler_stats()
+        self.model = artifact["model"]
+        self.is_trained = True
+
+    def _cache_scaler_stats(self):
+        """Keep the fitted scaler statistics as plain arrays for batched scaling"""
+        self._scaler_mean = self.scaler.mean_.astype(np.float64)
+        self._scaler_scale = self.scaler.scale_.astype(np.float64)
+
+    def _model_features(self, features: np.ndarray, pos_idx: np.ndarray) -> np.ndarray:
+        """Scaled numeric features followed by a one-hot position encoding"""
+        position_onehot = pos_idx[:, None] == np.arange(len(POSITIONS))
+        return np.hstack([self._scale_features(features), position_onehot])
+
+    def _scale_features(self, features: np.ndarray) -> np.ndarray:
+        """Standardize a feature matrix with the pre-fit scaler statistics"""
+        return (features - self._scaler_mean) / self._scaler_scale
 
     def generate_training_data(self) -> pd.DataFrame:
         """Generate synthetic training data (replace with real data in production)"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
+
+        # Generate fantasy points based on position and features
+        base_points = {
+            "RB": 180,
+            "WR": 160,
+            "TE": 120,
+            "QB": 300,
+            "K": 140,
+            "DST": 100,
+        }
 
-        data = []
-        positions = ["RB", "WR", "TE", "QB", "K", "DST"]
+        # Position-specific adjustments
+        position_multiplier = {
+            "QB": 0.9,  # QBs get slight penalty
+            "RB": 1.0,  # RBs are baseline
+            "WR": 1.0,  # WRs are baseline
+            "TE": 0.95,  # TEs get slight penalty
+            "K": 0.7,  # Kickers get penalty
+            "DST": 0.7,  # DSTs get penalty
+        }
 
-        for pos in positions:
+        frames = []
+        for pos in ["RB", "WR", "TE", "QB", "K", "DST"]:
             n_samples = 200 if pos in ["RB", "WR"] else 100
 
-            for i in range(n_samples):
-                adp = np.random.randint(1, 200)
-                tier = np.random.randint(1, 7)
-                age = (
-                    np.random.randint(21, 35)
-                    if pos != "DST"
-                    else np.random.randint(1, 10)
-                )
-                experience = (
-                    np.random.randint(0, 15)
-                    if pos != "DST"
-                    else np.random.randint(1, 10)
-                )
-                strength_of_schedule = np.random.uniform(0.5, 1.5)
-
-                # Generate fantasy points based on position and features
-                base_points = {
-                    "RB": 180,
-                    "WR": 160,
-                    "TE": 120,
-                    "QB": 300,
-                    "K": 140,
-                    "DST": 100,
-                }
-
-                # Improved ADP impact - much steeper penalty for high ADP
-                adp_penalty = (adp / 200) ** 3  # Cubic penalty for even steeper drop
-
-                # Tier impact - lower tier = higher points
-                tier_bonus = (6 - tier) * 0.15
-
-                # Position-specific adjustments
-                position_multiplier = {
-                    "QB": 0.9,  # QBs get slight penalty
-                    "RB": 1.0,  # RBs are baseline
-                    "WR": 1.0,  # WRs are baseline
-                    "TE": 0.95,  # TEs get slight penalty
-                    "K": 0.7,  # Kickers get penalty
-                    "DST": 0.7,  # DSTs get penalty
-                }
-
-                fantasy_points = (
-                    base_points[pos]
-                    * (1.0 - adp_penalty)  # Steeper ADP penalty
-                    * (1.0 + tier_bonus)  # Tier bonus
-                    * position_multiplier[pos]  # Position adjustment
-                    * (1.0 + np.random.normal(0, 0.15))  # Reduced random variation
-                )
+            # Draw every feature for the position as one vector
+            adp = rng.integers(1, 200, n_samples)
+            tier = rng.integers(1, 7, n_samples)
+            if pos != "DST":
+                age = rng.integers(21, 35, n_samples)
+                experience = rng.integers(0, 15, n_samples)
+            else:
+                age = rng.integers(1, 10, n_samples)
+                experience = rng.integers(1, 10, n_samples)
+            strength_of_schedule = rng.uniform(0.5, 1.5, n_samples)
+
+            # Improved ADP impact - much steeper penalty for high ADP
+            adp_penalty = (adp / 200) ** 3  # Cubic penalty for even steeper drop
+
+            # Tier impact - lower tier = higher points
+            tier_bonus = (6 - tier) * 0.15
+
+            fantasy_points = (
+                base_points[pos]
+                * (1.0 - adp_penalty)  # Steeper ADP penalty
+                * (1.0 + tier_bonus)  # Tier bonus
+                * position_multiplier[pos]  # Position adjustment
+                * (1.0 + rng.normal(0, 0.15, n_samples))  # Reduced random variation
+            )
 
-                data.append(
+            frames.append(
+                pd.DataFrame(
                     {
                         "position": pos,
                         "adp": adp,
@@ -139,11 +464,12 @@ class DraftMLModel:
                         "age": age,
                         "experience": experience,
                         "strength_of_schedule": strength_of_schedule,
-                        "fantasy_points": max(0, fantasy_points),
+                        "fantasy_points": np.maximum(0, fantasy_points),
                     }
                 )
+            )
 
-        return pd.DataFrame(data)
+        return pd.concat(frames, ignore_index=True)
 
     def get_recommendations(
         self,
@@ -157,199 +483,194 @@ class DraftMLModel:
         """Get ML-enhanced draft recommendations with proper roster constraints"""
 
         if not self.is_trained:
-            self.train_models()
+            self.load_or_train_models()
 
-        print(
-            f"🔍 DEBUG: Getting recommendations for Round {current_round}, Pick {draft_slot}"
-        )
-        print(f"🔍 DEBUG: Available players: {len(available_players)}")
-        print(f"🔍 DEBUG: Current roster: {len(current_roster)} players")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Getting recommendations for Round %d, Pick %d", current_round, draft_slot
+            )
+            logger.debug("Available players: %d", len(available_players))
+            logger.debug("Current roster: %d players", len(current_roster))
 
         # Ensure we have roster counts
         if roster_counts is None:
-            roster_counts = self.count_positions(current_roster)
+            roster_counts = RosterCounts(**self.count_positions(current_roster))
 
         # Get critical needs and depth needs
         critical_needs = roster_counts.get_critical_needs()
         depth_needs = roster_counts.get_depth_needs()
 
-        print(f"🔍 DEBUG: Critical needs: {critical_needs}")
-        print(f"🔍 DEBUG: Depth needs: {depth_needs}")
+        if debug:
+            logger.debug("Critical needs: %s", critical_needs)
+            logger.debug("Depth needs: %s", depth_needs)
 
-        recommendations = []
-
-        for player in available_players:
-            try:
-                # Check if we can add this position
-                if not roster_counts.can_add_position(player.position, current_round):
-                    print(
-                        f"🔍 DEBUG: {player.name} - Position {player.position} cannot be added at round {current_round}"
-                    )
-                    continue
-
-                # Calculate base score using ML model
-                ml_score = self.predict_player_value(player)
-                print(f"🔍 DEBUG: {player.name} - ML Score: {ml_score:.2f}")
-
-                # Calculate positional need score (MUCH higher weight now)
-                need_score = self.calculate_positional_need(
-                    player, current_roster, current_round, roster_counts
-                )
-                print(f"🔍 DEBUG: {player.name} - Need Score: {need_score:.2f}")
+        # Frozen sets for O(1) membership checks in the scoring helpers
+        critical_needs = frozenset(critical_needs)
+        depth_needs = frozenset(depth_needs)
 
-                # Calculate risk-adjusted score
-                risk_score = self.calculate_risk_adjusted_score(player, current_round)
-                print(f"🔍 DEBUG: {player.name} - Risk Score: {risk_score:.2f}")
+        # Unpack the players into column arrays once for all score functions
+        soa = _players_to_soa(available_players)
 
-                # Calculate handcuff value
-                handcuff_score = self.calculate_handcuff_value(player, current_roster)
-                print(f"🔍 DEBUG: {player.name} - Handcuff Score: {handcuff_score:.2f}")
+        # Prefilter to positions we can add this round, with a tier we can score,
+        # so the scoring below only touches viable candidates
+        addable = np.array(
+            [roster_counts.can_add_position(pos, current_round) for pos in POSITIONS] + [False]
+        )
+        valid_tier = ~np.isnan(soa["tier"])
+        if not valid_tier.all():
+            logger.warning("Skipping %d players with an invalid tier", np.count_nonzero(~valid_tier))
+        candidate_idx = np.flatnonzero(addable[soa["pos_idx"]] & valid_tier)
+        soa = {key: column[candidate_idx] for key, column in soa.items()}
+
+        adp, tier, pos_idx = soa["adp"], soa["tier"], soa["pos_idx"]
+        tier_i = tier.astype(np.int64)
+        is_k_dst = (pos_idx == POSITION_CODES["K"]) | (pos_idx == POSITION_CODES["DST"])
+
+        # Calculate base scores for every candidate in one batched ML call
+        ml_scores = self._predict_values(soa)
+
+        # Calculate positional need score (MUCH higher weight now) - depends only on position
+        need_table = np.array(
+            [
+                self._position_need(pos, current_round, roster_counts, critical_needs, depth_needs)
+                for pos in POSITIONS
+            ]
+            + [0.0]
+        )
+        need_scores = need_table[pos_idx]
 
-                # Calculate round-specific adjustments
-                round_score = self.calculate_round_adjustments(
-                    player, current_round, draft_slot, teams
-                )
-                print(f"🔍 DEBUG: {player.name} - Round Score: {round_score:.2f}")
-
-                # Combine all scores with MUCH higher need weight
-                total_score = (
-                    ml_score * 0.4  # ML score (40% - reduced from 80%)
-                    + need_score * 0.4  # Positional need (40% - increased from 10%)
-                    + risk_score * 0.1  # Risk assessment (10% - increased from 5%)
-                    + handcuff_score * 0.05  # Handcuff value (5% - increased from 3%)
-                    + round_score * 0.05  # Round adjustments (5% - increased from 2%)
-                )
+        # Calculate risk-adjusted scores
+        risk_scores = self._risk_adjusted_scores(adp, tier_i, is_k_dst, current_round)
 
-                # Apply roster constraint bonuses
-                if player.position in critical_needs:
-                    total_score *= 2.0  # Double score for critical needs
-                    print(f"🔍 DEBUG: {player.name} - Critical need bonus applied")
-
-                # Final ADP validation - smarter round-based penalties
-                if current_round <= 3:
-                    if player.adp > 50:
-                        total_score *= (
-                            0.6  # Heavy penalty for ADP > 50 in first 3 rounds
-                        )
-                    elif player.adp > 30:
-                        total_score *= (
-                            0.8  # Moderate penalty for ADP > 30 in first 3 rounds
-                        )
-                elif current_round <= 5:
-                    if player.adp > 80:
-                        total_score *= 0.7  # Penalty for ADP > 80 in rounds 4-5
-                elif current_round <= 8:
-                    if player.adp > 120:
-                        total_score *= 0.8  # Light penalty for ADP > 120 in rounds 6-8
-
-                print(f"🔍 DEBUG: {player.name} - Total Score: {total_score:.2f}")
-
-                # Generate reasoning
-                reasoning = self.generate_reasoning(
-                    player,
-                    ml_score,
-                    need_score,
-                    risk_score,
-                    handcuff_score,
-                    round_score,
-                    critical_needs,
-                    depth_needs,
-                )
+        # Calculate handcuff values from the roster RBs' teams
+        handcuff_by_team = self._handcuff_values_by_team(current_roster)
+        handcuff_scores = np.fromiter(
+            (handcuff_by_team.get(team, 0) for team in soa["team"]),
+            dtype=np.int64,
+            count=len(candidate_idx),
+        )
+        handcuff_scores[pos_idx != POSITION_CODES["RB"]] = 0
 
-                # Calculate confidence and risk factors
-                confidence = self.calculate_confidence(player, current_round)
-                risk_factor = self.calculate_risk_factor(player)
-                upside_potential = self.calculate_upside_potential(player)
-
-                # Determine priority
-                priority = self.determine_priority(total_score, confidence, risk_factor)
-
-                recommendations.append(
-                    Recommendation(
-                        player=player,
-                        score=total_score,
-                        priority=priority,
-                        reasoning=reasoning,
-                        confidence=confidence,
-                        risk_factor=risk_factor,
-                        upside_potential=upside_potential,
-                        ml_score=ml_score,
-                        need_score=need_score,
-                        risk_score=risk_score,
-                        handcuff_score=handcuff_score,
-                        round_score=round_score,
-                    )
-                )
+        # Calculate round-specific adjustments
+        expected_pick = self.calculate_expected_pick(current_round, draft_slot, teams)
+        round_scores = self._round_adjustments(adp, is_k_dst, current_round, expected_pick)
+
+        is_critical = np.array([pos in critical_needs for pos in POSITIONS] + [False])
+        total_scores = _total_scores(
+            ml_scores,
+            need_scores,
+            risk_scores,
+            handcuff_scores,
+            round_scores,
+            is_critical[pos_idx],
+            adp,
+            current_round,
+        )
 
-            except Exception as e:
-                print(f"🔍 DEBUG: Error processing {player.name}: {str(e)}")
-                continue
+        # Keep the top 10 by total score (stable, highest first) without sorting everyone
+        top_idx = _top_k(total_scores, 10)
 
-        # Sort by total score
-        recommendations.sort(key=lambda x: x.score, reverse=True)
+        # Only the top picks get reasoning and full Recommendation objects
+        recommendations = []
+        for i in top_idx.tolist():
+            player = available_players[candidate_idx[i]]
+            total_score = float(total_scores[i])
+            ml_score = float(ml_scores[i])
+            need_score = float(need_scores[i])
+            risk_score = int(risk_scores[i])
+            handcuff_score = int(handcuff_scores[i])
+            round_score = int(round_scores[i])
+
+            # Generate reasoning
+            reasoning = self.generate_reasoning(
+                player,
+                ml_score,
+                need_score,
+                risk_score,
+                handcuff_score,
+                round_score,
+                critical_needs,
+                depth_needs,
+            )
 
-        print(f"🔍 DEBUG: Top 5 recommendations:")
-        for i, rec in enumerate(recommendations[:5]):
-            print(
-                f"   {i+1}. {rec.player.name} ({rec.player.position}, ADP {rec.player.adp}): {rec.score:.2f}"
+            # Calculate confidence and risk factors
+            confidence = self.calculate_confidence(player, current_round)
+            risk_factor = self.calculate_risk_factor(player)
+            upside_potential = self.calculate_upside_potential(player)
+
+            # Determine priority
+            priority = self.determine_priority(total_score, confidence, risk_factor)
+
+            recommendations.append(
+                Recommendation(
+                    player=player,
+                    score=total_score,
+                    priority=priority,
+                    reasoning=reasoning,
+                    confidence=confidence,
+                    risk_factor=risk_factor,
+                    upside_potential=upside_potential,
+                    ml_score=ml_score,
+                    need_score=need_score,
+                    risk_score=risk_score,
+                    handcuff_score=handcuff_score,
+                    round_score=round_score,
+                )
             )
 
-        return recommendations[:10]  # Return top 10
+        if debug:
+            logger.debug("Top 5 recommendations:")
+            for i, rec in enumerate(recommendations[:5]):
+                logger.debug(
+                    "   %d. %s (%s, ADP %s): %.2f",
+                    i + 1,
+                    rec.player.name,
+                    rec.player.position,
+                    rec.player.adp,
+                    rec.score,
+                )
+
+        return recommendations
 
     def predict_player_value(self, player: Player) -> float:
         """Predict player value using ML model"""
-        try:
-            # Use fallback scoring - ML models are disabled for now
-            if False and player.position in self.models and self.is_trained:
-                # Prepare features
-                features = np.array(
+        return self.predict_player_values([player])[0]
+
+    def predict_player_values(self, players: List[Player]) -> List[float]:
+        """Predict values for a batch of players in one vectorized pass"""
+        return self._predict_values(_players_to_soa(players)).tolist()
+
+    def _predict_values(self, soa: Dict[str, np.ndarray]) -> np.ndarray:
+        """Predict player values from the column arrays built by _players_to_soa"""
+        adp, tier, pos_idx = soa["adp"], soa["tier"], soa["pos_idx"]
+        position_multiplier = POSITION_VALUE_MULTIPLIER[pos_idx]
+
+        # Improved fallback scoring that properly considers ADP vs tier:
+        # ADP penalty (higher ADP = lower score), tier bonus (lower tier number = higher score)
+        scores = np.clip((200 - adp * 0.8 + (6 - tier) * 15) * position_multiplier, 0, 300)
+
+        # Emergency fallback for unparseable tiers - simple ADP-based scoring
+        scores = np.where(np.isnan(tier), np.maximum(0, 200 - adp), scores)
+
+        # Use fallback scoring - ML models are disabled for now
+        if False and self.is_trained:
+            # Single predict call over every player with a known position and tier
+            idx = np.flatnonzero((pos_idx != UNKNOWN_POSITION_CODE) & ~np.isnan(tier))
+            if idx.size:
+                features = np.column_stack(
                     [
-                        [
-                            player.adp,
-                            int(player.tier),
-                            player.age or 25,
-                            player.experience or 3,
-                            player.strength_of_schedule or 1.0,
-                        ]
+                        adp,
+                        tier,
+                        _or_default(soa["age"], 25),
+                        _or_default(soa["experience"], 3),
+                        _or_default(soa["sos"], 1.0),
                     ]
                 )
+                features = self._model_features(features[idx], pos_idx[idx])
+                scores[idx] = np.maximum(0, self.model.predict(features))
 
-                # Scale features
-                features_scaled = self.scaler.fit_transform(features)
-
-                # Predict
-                prediction = self.models[player.position].predict(features_scaled)[0]
-                return max(0, prediction)
-            else:
-                # Improved fallback scoring that properly considers ADP vs tier
-                base_score = 200
-
-                # ADP penalty (higher ADP = lower score)
-                adp_penalty = player.adp * 0.8
-
-                # Tier bonus (lower tier number = higher score)
-                tier_bonus = (6 - int(player.tier)) * 15
-
-                # Position-specific adjustments
-                position_multiplier = {
-                    "QB": 0.9,  # QBs get slight penalty in early rounds
-                    "RB": 1.0,  # RBs are baseline
-                    "WR": 1.0,  # WRs are baseline
-                    "TE": 0.95,  # TEs get slight penalty
-                    "K": 0.3,  # Kickers heavily penalized early
-                    "DST": 0.3,  # DSTs heavily penalized early
-                }
-
-                # Calculate final score
-                final_score = (
-                    base_score - adp_penalty + tier_bonus
-                ) * position_multiplier.get(player.position, 1.0)
-
-                # Ensure reasonable bounds
-                return max(0, min(300, final_score))
-        except:
-            # Emergency fallback - simple ADP-based scoring
-            return max(0, 200 - player.adp)
+        return scores
 
     def calculate_positional_need(
         self,
@@ -361,12 +682,26 @@ class DraftMLModel:
         """Calculate how much we need this position with proper roster constraints"""
         # Use the roster_counts passed from the API instead of recalculating
         if roster_counts is None:
-            roster_counts = self.count_positions(current_roster)
-        position = player.position
+            roster_counts = RosterCounts(**self.count_positions(current_roster))
 
         # Get critical and depth needs
-        critical_needs = roster_counts.get_critical_needs()
-        depth_needs = roster_counts.get_depth_needs()
+        return self._position_need(
+            player.position,
+            current_round,
+            roster_counts,
+            frozenset(roster_counts.get_critical_needs()),
+            frozenset(roster_counts.get_depth_needs()),
+        )
+
+    def _position_need(
+        self,
+        position: str,
+        current_round: int,
+        roster_counts: RosterCounts,
+        critical_needs: FrozenSet[str],
+        depth_needs: FrozenSet[str],
+    ) -> float:
+        """Positional need score - depends only on the position, not the player"""
 
         # Base need scores - MUCH more aggressive for critical needs
         if position in critical_needs:
@@ -423,38 +758,49 @@ class DraftMLModel:
         self, player: Player, current_round: int
     ) -> float:
         """Calculate risk-adjusted score based on round and player characteristics"""
-        base_score = 50
+        return int(
+            self._risk_adjusted_scores(
+                np.array([player.adp]),
+                np.array([int(player.tier)]),
+                np.array([player.position in ["K", "DST"]]),
+                current_round,
+            )[0]
+        )
+
+    def _risk_adjusted_scores(
+        self,
+        adp: np.ndarray,
+        tier: np.ndarray,
+        is_k_dst: np.ndarray,
+        current_round: int,
+    ) -> np.ndarray:
+        """Risk-adjusted scores for parallel adp/tier/K-DST arrays"""
+        base_score = np.full(len(adp), 50, dtype=np.int64)
 
         # Round-based risk adjustment
         if current_round <= 3:
             # Early rounds: lower risk tolerance - heavily penalize high ADP players
-            if player.adp > 50:
-                base_score -= 40  # Increased penalty
-            if player.adp > 100:
-                base_score -= 60  # Even bigger penalty for very high ADP
+            base_score[adp > 50] -= 40  # Increased penalty
+            base_score[adp > 100] -= 60  # Even bigger penalty for very high ADP
         elif current_round <= 7:
             # Mid rounds: moderate risk tolerance
-            if player.adp > 100:
-                base_score -= 30
+            base_score[adp > 100] -= 30
         elif current_round >= 12:
             # Late rounds: higher risk tolerance
-            if player.adp <= 100:
-                base_score += 20
+            base_score[adp <= 100] += 20
 
         # Position-based risk adjustment
-        if player.position in ["K", "DST"] and current_round < 12:
-            base_score -= 50  # Increased penalty for K/DST too early
+        if current_round < 12:
+            base_score[is_k_dst] -= 50  # Increased penalty for K/DST too early
 
         # Tier-based risk adjustment
-        tier_risk = (6 - int(player.tier)) * 8  # Increased tier importance
-        base_score += tier_risk
+        base_score += (6 - tier) * 8  # Increased tier importance
 
         # ADP vs Round validation
         expected_pick = current_round * 10  # Rough estimate
-        if player.adp > expected_pick + 30:
-            base_score -= 25  # Penalty for drafting too early
+        base_score[adp > expected_pick + 30] -= 25  # Penalty for drafting too early
 
-        return max(0, base_score)
+        return np.maximum(0, base_score)
 
     def calculate_handcuff_value(
         self, player: Player, current_roster: List[Player]
@@ -464,37 +810,54 @@ class DraftMLModel:
             return 0
 
         # Check if this player is a backup to someone on our roster
+        return self._handcuff_values_by_team(current_roster).get(player.team, 0)
+
+    def _handcuff_values_by_team(self, current_roster: List[Player]) -> Dict[str, int]:
+        """Handcuff bonus for an RB on each team, keyed off the first roster RB per team"""
+        values = {}
         for roster_player in current_roster:
-            if roster_player.position == "RB" and roster_player.team == player.team:
+            if roster_player.position == "RB" and roster_player.team not in values:
                 # Higher bonus for handcuffs to your top RBs
                 if roster_player.adp <= 20:  # Elite RB handcuff
-                    return 40
+                    values[roster_player.team] = 40
                 elif roster_player.adp <= 50:  # Good RB handcuff
-                    return 30
+                    values[roster_player.team] = 30
                 else:  # Depth RB handcuff
-                    return 20
-
-        return 0
+                    values[roster_player.team] = 20
+        return values
 
     def calculate_round_adjustments(
         self, player: Player, current_round: int, draft_slot: int, teams: int
     ) -> float:
         """Calculate round-specific adjustments"""
-        score = 0
-
         # Calculate expected pick number
         expected_pick = self.calculate_expected_pick(current_round, draft_slot, teams)
+        return int(
+            self._round_adjustments(
+                np.array([player.adp]),
+                np.array([player.position in ["K", "DST"]]),
+                current_round,
+                expected_pick,
+            )[0]
+        )
+
+    def _round_adjustments(
+        self,
+        adp: np.ndarray,
+        is_k_dst: np.ndarray,
+        current_round: int,
+        expected_pick: int,
+    ) -> np.ndarray:
+        """Round-specific adjustments for parallel adp/K-DST arrays"""
+        score = np.zeros(len(adp), dtype=np.int64)
 
         # Value vs. need balance
-        if player.adp < expected_pick - 20:
-            score += 25  # Player fell significantly
-        elif player.adp > expected_pick + 20:
-            score -= 15  # Player is a reach
+        score[adp < expected_pick - 20] += 25  # Player fell significantly
+        score[adp > expected_pick + 20] -= 15  # Player is a reach
 
         # Position scarcity in later rounds
         if current_round >= 8:
-            if player.position in ["K", "DST"]:
-                score += 20
+            score[is_k_dst] += 20
 
         return score
 
@@ -507,10 +870,13 @@ class DraftMLModel:
 
     def count_positions(self, roster: List[Player]) -> Dict[str, int]:
         """Count players by position in roster"""
-        counts = {"QB": 0, "RB": 0, "WR": 0, "TE": 0, "K": 0, "DST": 0}
-        for player in roster:
-            counts[player.position] += 1
-        return counts
+        pos_idx = np.fromiter(
+            (POSITION_CODES.get(p.position, UNKNOWN_POSITION_CODE) for p in roster),
+            dtype=np.int8,
+            count=len(roster),
+        )
+        counts = np.bincount(pos_idx, minlength=len(POSITIONS) + 1)
+        return {pos: int(counts[i]) for i, pos in enumerate(POSITIONS)}
 
     def generate_reasoning(
         self,
@@ -520,11 +886,12 @@ class DraftMLModel:
         risk_score: float,
         handcuff_score: float,
         round_score: float,
-        critical_needs: List[str] = None,
-        depth_needs: List[str] = None,
+        critical_needs: FrozenSet[str] = None,
+        depth_needs: FrozenSet[str] = None,
     ) -> List[str]:
         """Generate reasoning for recommendation with roster context"""
         reasons = []
+        is_critical = bool(critical_needs) and player.position in critical_needs
 
         # ML Score reasoning
         if ml_score > 180:
@@ -535,7 +902,7 @@ class DraftMLModel:
             reasons.append("Good ML-predicted value")
 
         # Need-based reasoning with roster context
-        if critical_needs and player.position in critical_needs:
+        if is_critical:
             reasons.append("🚨 CRITICAL NEED - Must fill this position!")
         elif depth_needs and player.position in depth_needs:
             reasons.append("📈 Depth need - Builds roster strength")
@@ -571,13 +938,14 @@ class DraftMLModel:
             reasons.append("Strong ADP")
 
         # Tier reasoning
-        if player.tier == "1":
+        tier = _parse_tier(player.tier)
+        if tier == 1:
             reasons.append("⭐ Tier 1 talent")
-        elif player.tier == "2":
+        elif tier == 2:
             reasons.append("Tier 2 talent")
 
         # Roster constraint reasoning
-        if critical_needs and player.position in critical_needs:
+        if is_critical:
             if player.position == "QB":
                 reasons.append("🎯 No QB on roster - MUST DRAFT")
             elif player.position == "RB":
@@ -617,7 +985,7 @@ class DraftMLModel:
             base_confidence += 0.2
 
         # Higher confidence for tier 1 players
-        if player.tier == "1":
+        if _parse_tier(player.tier) == 1:
             base_confidence += 0.1
 
         # Lower confidence for K/DST in early rounds
@@ -657,7 +1025,7 @@ class DraftMLModel:
             base_upside += 0.1
 
         # Higher upside for tier 1 players
-        if player.tier == "1":
+        if _parse_tier(player.tier) == 1:
             base_upside += 0.1
 
         return min(1.0, max(0.0, base_upside))
@@ -667,31 +1035,11 @@ class DraftMLModel:
     ) -> str:
         """Get strategic insights for current round with roster constraints"""
         # Get current needs
-        critical_needs = roster_counts.get_critical_needs()
-        depth_needs = roster_counts.get_depth_needs()
-
-        if current_round <= 3:
-            if critical_needs:
-                return f"🎯 EARLY ROUNDS: CRITICAL NEEDS - Must draft: {', '.join(critical_needs)}"
-            else:
-                return "🎯 EARLY ROUNDS: Focus on best available player"
-        elif current_round <= 7:
-            if critical_needs:
-                return f"🏗️ MID ROUNDS: CRITICAL NEEDS - Must draft: {', '.join(critical_needs)}"
-            elif depth_needs:
-                return f"🏗️ MID ROUNDS: Build depth at: {', '.join(depth_needs)}"
-            else:
-                return "🏗️ MID ROUNDS: Build roster depth and value"
-        elif current_round <= 11:
-            if critical_needs:
-                return f"📈 LATE MID: CRITICAL NEEDS remaining: {', '.join(critical_needs)}"
-            else:
-                return "📈 LATE MID: Focus on depth, value picks, and handcuffs"
-        else:
-            if critical_needs:
-                return f"⏰ LATE ROUNDS: MUST FILL: {', '.join(critical_needs)}"
-            else:
-                return "⏰ LATE ROUNDS: Fill remaining needs and optimize bench"
+        return _strategy_insights(
+            current_round,
+            roster_counts.get_critical_needs(),
+            roster_counts.get_depth_needs(),
+        )
 
     def get_draft_insights(
         self, available_players: List[Player], roster_counts: RosterCounts
@@ -699,11 +1047,8 @@ class DraftMLModel:
         """Get insights about the current draft state"""
         insights = []
 
-        # Count available players by position
-        position_counts = {}
-        for player in available_players:
-            pos = player.position
-            position_counts[pos] = position_counts.get(pos, 0) + 1
+        # Count available players by position (Counter keeps first-seen order for the insights)
+        position_counts = Counter(player.position for player in available_players)
 
         # Generate insights
         for pos, count in position_counts.items():
@@ -720,21 +1065,17 @@ class DraftMLModel:
         self, current_round: int, roster_counts: RosterCounts
     ) -> str:
         """Get focus for the next round"""
-        if current_round <= 3:
-            return "Best available player regardless of position"
-        elif current_round <= 7:
-            return "Balance positional needs with value"
-        elif current_round <= 11:
-            return "Build roster depth and consider handcuffs"
-        else:
-            return "Fill remaining needs and target K/DST"
+        return _next_round_focus(current_round)
 
     def get_risk_assessment(
         self, available_players: List[Player], roster_counts: RosterCounts
     ) -> str:
         """Get overall risk assessment"""
-        high_risk_count = sum(1 for p in available_players if p.adp > 100)
-        total_players = len(available_players)
+        adp = np.fromiter(
+            (p.adp for p in available_players), dtype=np.float64, count=len(available_players)
+        )
+        high_risk_count = int(np.count_nonzero(adp > 100))
+        total_players = max(1, adp.size)
         risk_percentage = (high_risk_count / total_players) * 100
 
         if risk_percentage > 70:
@@ -744,1133 +1085,56 @@ class DraftMLModel:
         else:
             return "Low risk - many quality players available"
 
-    def get_sample_players(self) -> List[Dict]:
-        """Get sample player data - full 160 players from CSV"""
-        return [
-            {
-                "name": "Ja'Marr Chase",
-                "position": "WR",
-                "team": "CIN",
-                "adp": 1,
-                "tier": "1",
-            },
-            {
-                "name": "Bijan Robinson",
-                "position": "RB",
-                "team": "ATL",
-                "adp": 2,
-                "tier": "1",
-            },
-            {
-                "name": "Saquon Barkley",
-                "position": "RB",
-                "team": "PHI",
-                "adp": 3,
-                "tier": "1",
-            },
-            {
-                "name": "Justin Jefferson",
-                "position": "WR",
-                "team": "MIN",
-                "adp": 4,
-                "tier": "1",
-            },
-            {
-                "name": "Jahmyr Gibbs",
-                "position": "RB",
-                "team": "DET",
-                "adp": 5,
-                "tier": "1",
-            },
-            {
-                "name": "CeeDee Lamb",
-                "position": "WR",
-                "team": "DAL",
-                "adp": 6,
-                "tier": "1",
-            },
-            {
-                "name": "Christian McCaffrey",
-                "position": "RB",
-                "team": "SF",
-                "adp": 7,
-                "tier": "1",
-            },
-            {
-                "name": "Amon-Ra St. Brown",
-                "position": "WR",
-                "team": "DET",
-                "adp": 8,
-                "tier": "1",
-            },
-            {
-                "name": "Malik Nabers",
-                "position": "WR",
-                "team": "NYG",
-                "adp": 9,
-                "tier": "1",
-            },
-            {
-                "name": "Puka Nacua",
-                "position": "WR",
-                "team": "LAR",
-                "adp": 10,
-                "tier": "1",
-            },
-            {
-                "name": "Nico Collins",
-                "position": "WR",
-                "team": "HOU",
-                "adp": 11,
-                "tier": "2",
-            },
-            {
-                "name": "Tyreek Hill",
-                "position": "WR",
-                "team": "MIA",
-                "adp": 12,
-                "tier": "2",
-            },
-            {
-                "name": "A.J. Brown",
-                "position": "WR",
-                "team": "PHI",
-                "adp": 13,
-                "tier": "2",
-            },
-            {
-                "name": "Drake London",
-                "position": "WR",
-                "team": "ATL",
-                "adp": 14,
-                "tier": "2",
-            },
-            {
-                "name": "Ashton Jeanty",
-                "position": "RB",
-                "team": "LV",
-                "adp": 15,
-                "tier": "2",
-            },
-            {
-                "name": "Derrick Henry",
-                "position": "RB",
-                "team": "BAL",
-                "adp": 16,
-                "tier": "2",
-            },
-            {
-                "name": "De'Von Achane",
-                "position": "RB",
-                "team": "MIA",
-                "adp": 17,
-                "tier": "2",
-            },
-            {
-                "name": "Brian Thomas Jr.",
-                "position": "WR",
-                "team": "JAX",
-                "adp": 18,
-                "tier": "2",
-            },
-            {
-                "name": "Jonathan Taylor",
-                "position": "RB",
-                "team": "IND",
-                "adp": 19,
-                "tier": "2",
-            },
-            {
-                "name": "Josh Jacobs",
-                "position": "RB",
-                "team": "GB",
-                "adp": 20,
-                "tier": "2",
-            },
-            {
-                "name": "Brock Bowers",
-                "position": "TE",
-                "team": "LV",
-                "adp": 21,
-                "tier": "2",
-            },
-            {
-                "name": "Trey McBride",
-                "position": "TE",
-                "team": "ARI",
-                "adp": 22,
-                "tier": "2",
-            },
-            {
-                "name": "Kyren Williams",
-                "position": "RB",
-                "team": "LAR",
-                "adp": 23,
-                "tier": "3",
-            },
-            {
-                "name": "James Cook",
-                "position": "RB",
-                "team": "BUF",
-                "adp": 24,
-                "tier": "3",
-            },
-            {
-                "name": "Tee Higgins",
-                "position": "WR",
-                "team": "CIN",
-                "adp": 25,
-                "tier": "3",
-            },
-            {
-                "name": "Jaxon Smith-Njigba",
-                "position": "WR",
-                "team": "SEA",
-                "adp": 26,
-                "tier": "3",
-            },
-            {
-                "name": "Mike Evans",
-                "position": "WR",
-                "team": "TB",
-                "adp": 27,
-                "tier": "3",
-            },
-            {
-                "name": "Terry McLaurin",
-                "position": "WR",
-                "team": "WSH",
-                "adp": 28,
-                "tier": "3",
-            },
-            {
-                "name": "Davante Adams",
-                "position": "WR",
-                "team": "LAR",
-                "adp": 29,
-                "tier": "3",
-            },
-            {
-                "name": "DK Metcalf",
-                "position": "WR",
-                "team": "PIT",
-                "adp": 30,
-                "tier": "3",
-            },
-            {
-                "name": "Garrett Wilson",
-                "position": "WR",
-                "team": "NYJ",
-                "adp": 31,
-                "tier": "3",
-            },
-            {
-                "name": "DJ Moore",
-                "position": "WR",
-                "team": "CHI",
-                "adp": 32,
-                "tier": "3",
-            },
-            {
-                "name": "DeVonta Smith",
-                "position": "WR",
-                "team": "PHI",
-                "adp": 33,
-                "tier": "3",
-            },
-            {
-                "name": "Jaylen Waddle",
-                "position": "WR",
-                "team": "MIA",
-                "adp": 34,
-                "tier": "3",
-            },
-            {
-                "name": "Chris Olave",
-                "position": "WR",
-                "team": "NO",
-                "adp": 35,
-                "tier": "3",
-            },
-            {
-                "name": "Stefon Diggs",
-                "position": "WR",
-                "team": "NE",
-                "adp": 36,
-                "tier": "3",
-            },
-            {
-                "name": "Cooper Kupp",
-                "position": "WR",
-                "team": "SEA",
-                "adp": 37,
-                "tier": "3",
-            },
-            {
-                "name": "Zay Flowers",
-                "position": "WR",
-                "team": "BAL",
-                "adp": 38,
-                "tier": "3",
-            },
-            {
-                "name": "Xavier Worthy",
-                "position": "WR",
-                "team": "KC",
-                "adp": 39,
-                "tier": "3",
-            },
-            {
-                "name": "Jameson Williams",
-                "position": "WR",
-                "team": "DET",
-                "adp": 40,
-                "tier": "3",
-            },
-            {
-                "name": "Isiah Pacheco",
-                "position": "RB",
-                "team": "KC",
-                "adp": 41,
-                "tier": "3",
-            },
-            {
-                "name": "Kenneth Walker III",
-                "position": "RB",
-                "team": "SEA",
-                "adp": 42,
-                "tier": "3",
-            },
-            {
-                "name": "David Montgomery",
-                "position": "RB",
-                "team": "DET",
-                "adp": 43,
-                "tier": "3",
-            },
-            {
-                "name": "Alvin Kamara",
-                "position": "RB",
-                "team": "NO",
-                "adp": 44,
-                "tier": "3",
-            },
-            {
-                "name": "Breece Hall",
-                "position": "RB",
-                "team": "NYJ",
-                "adp": 45,
-                "tier": "3",
-            },
-            {
-                "name": "Chase Brown",
-                "position": "RB",
-                "team": "CIN",
-                "adp": 46,
-                "tier": "3",
-            },
-            {
-                "name": "Bucky Irving",
-                "position": "RB",
-                "team": "TB",
-                "adp": 47,
-                "tier": "3",
-            },
-            {
-                "name": "Omarion Hampton",
-                "position": "RB",
-                "team": "CAR",
-                "adp": 48,
-                "tier": "3",
-            },
-            {
-                "name": "TreVeyon Henderson",
-                "position": "RB",
-                "team": "NE",
-                "adp": 49,
-                "tier": "3",
-            },
-            {
-                "name": "Chuba Hubbard",
-                "position": "RB",
-                "team": "CAR",
-                "adp": 50,
-                "tier": "3",
-            },
-            {
-                "name": "James Conner",
-                "position": "RB",
-                "team": "ARI",
-                "adp": 51,
-                "tier": "4",
-            },
-            {
-                "name": "Aaron Jones",
-                "position": "RB",
-                "team": "MIN",
-                "adp": 52,
-                "tier": "4",
-            },
-            {
-                "name": "Tony Pollard",
-                "position": "RB",
-                "team": "TEN",
-                "adp": 53,
-                "tier": "4",
-            },
-            {
-                "name": "Rhamondre Stevenson",
-                "position": "RB",
-                "team": "NE",
-                "adp": 54,
-                "tier": "4",
-            },
-            {
-                "name": "Travis Etienne",
-                "position": "RB",
-                "team": "JAX",
-                "adp": 55,
-                "tier": "4",
-            },
-            {
-                "name": "Joe Mixon",
-                "position": "RB",
-                "team": "HOU",
-                "adp": 56,
-                "tier": "4",
-            },
-            {
-                "name": "Khalil Shakir",
-                "position": "WR",
-                "team": "BUF",
-                "adp": 57,
-                "tier": "4",
-            },
-            {
-                "name": "Emeka Egbuka",
-                "position": "WR",
-                "team": "TB",
-                "adp": 58,
-                "tier": "4",
-            },
-            {
-                "name": "Ricky Pearsall",
-                "position": "WR",
-                "team": "SF",
-                "adp": 59,
-                "tier": "4",
-            },
-            {
-                "name": "Jordan Addison",
-                "position": "WR",
-                "team": "MIN",
-                "adp": 60,
-                "tier": "4",
-            },
-            {
-                "name": "Keon Coleman",
-                "position": "WR",
-                "team": "BUF",
-                "adp": 61,
-                "tier": "4",
-            },
-            {
-                "name": "Rome Odunze",
-                "position": "WR",
-                "team": "CHI",
-                "adp": 62,
-                "tier": "4",
-            },
-            {
-                "name": "Christian Kirk",
-                "position": "WR",
-                "team": "JAX",
-                "adp": 63,
-                "tier": "4",
-            },
-            {
-                "name": "Brandin Cooks",
-                "position": "WR",
-                "team": "DAL",
-                "adp": 64,
-                "tier": "4",
-            },
-            {
-                "name": "Josh Downs",
-                "position": "WR",
-                "team": "IND",
-                "adp": 65,
-                "tier": "4",
-            },
-            {
-                "name": "Tyler Lockett",
-                "position": "WR",
-                "team": "SEA",
-                "adp": 66,
-                "tier": "4",
-            },
-            {
-                "name": "Amari Cooper",
-                "position": "WR",
-                "team": "CLE",
-                "adp": 67,
-                "tier": "4",
-            },
-            {
-                "name": "Deebo Samuel Sr.",
-                "position": "WR",
-                "team": "SF",
-                "adp": 68,
-                "tier": "4",
-            },
-            {
-                "name": "Marquise Brown",
-                "position": "WR",
-                "team": "KC",
-                "adp": 69,
-                "tier": "4",
-            },
-            {
-                "name": "Michael Pittman Jr.",
-                "position": "WR",
-                "team": "IND",
-                "adp": 70,
-                "tier": "4",
-            },
-            {
-                "name": "George Pickens",
-                "position": "WR",
-                "team": "PIT",
-                "adp": 71,
-                "tier": "4",
-            },
-            {
-                "name": "Courtland Sutton",
-                "position": "WR",
-                "team": "DEN",
-                "adp": 72,
-                "tier": "4",
-            },
-            {
-                "name": "Jerry Jeudy",
-                "position": "WR",
-                "team": "CLE",
-                "adp": 73,
-                "tier": "4",
-            },
-            {
-                "name": "Jakobi Meyers",
-                "position": "WR",
-                "team": "LV",
-                "adp": 74,
-                "tier": "4",
-            },
-            {
-                "name": "Rashod Bateman",
-                "position": "WR",
-                "team": "BAL",
-                "adp": 75,
-                "tier": "4",
-            },
-            {
-                "name": "Romeo Doubs",
-                "position": "WR",
-                "team": "GB",
-                "adp": 76,
-                "tier": "4",
-            },
-            {
-                "name": "Jahan Dotson",
-                "position": "WR",
-                "team": "WSH",
-                "adp": 77,
-                "tier": "4",
-            },
-            {
-                "name": "Elijah Moore",
-                "position": "WR",
-                "team": "CLE",
-                "adp": 78,
-                "tier": "4",
-            },
-            {
-                "name": "Gabe Davis",
-                "position": "WR",
-                "team": "JAX",
-                "adp": 79,
-                "tier": "4",
-            },
-            {
-                "name": "Curtis Samuel",
-                "position": "WR",
-                "team": "BUF",
-                "adp": 80,
-                "tier": "4",
-            },
-            {
-                "name": "Tank Dell",
-                "position": "WR",
-                "team": "HOU",
-                "adp": 81,
-                "tier": "5",
-            },
-            {
-                "name": "Quentin Johnston",
-                "position": "WR",
-                "team": "LAC",
-                "adp": 82,
-                "tier": "5",
-            },
-            {
-                "name": "Wan'Dale Robinson",
-                "position": "WR",
-                "team": "NYG",
-                "adp": 83,
-                "tier": "5",
-            },
-            {
-                "name": "Demario Douglas",
-                "position": "WR",
-                "team": "NE",
-                "adp": 84,
-                "tier": "5",
-            },
-            {
-                "name": "Jalen Nailor",
-                "position": "WR",
-                "team": "MIN",
-                "adp": 85,
-                "tier": "5",
-            },
-            {
-                "name": "Matthew Golden",
-                "position": "WR",
-                "team": "GB",
-                "adp": 86,
-                "tier": "5",
-            },
-            {
-                "name": "Tyler Boyd",
-                "position": "WR",
-                "team": "TEN",
-                "adp": 87,
-                "tier": "5",
-            },
-            {
-                "name": "Mecole Hardman",
-                "position": "WR",
-                "team": "KC",
-                "adp": 88,
-                "tier": "5",
-            },
-            {
-                "name": "Darnell Mooney",
-                "position": "WR",
-                "team": "ATL",
-                "adp": 89,
-                "tier": "5",
-            },
-            {
-                "name": "Adam Thielen",
-                "position": "WR",
-                "team": "CAR",
-                "adp": 90,
-                "tier": "5",
-            },
-            {
-                "name": "Jayden Reed",
-                "position": "WR",
-                "team": "GB",
-                "adp": 91,
-                "tier": "5",
-            },
-            {
-                "name": "Tutu Atwell",
-                "position": "WR",
-                "team": "LAR",
-                "adp": 92,
-                "tier": "5",
-            },
-            {
-                "name": "Jonathan Mingo",
-                "position": "WR",
-                "team": "CAR",
-                "adp": 93,
-                "tier": "5",
-            },
-            {
-                "name": "Kendrick Bourne",
-                "position": "WR",
-                "team": "NE",
-                "adp": 94,
-                "tier": "5",
-            },
-            {
-                "name": "Michael Wilson",
-                "position": "WR",
-                "team": "ARI",
-                "adp": 95,
-                "tier": "5",
-            },
-            {
-                "name": "Noah Brown",
-                "position": "WR",
-                "team": "HOU",
-                "adp": 96,
-                "tier": "5",
-            },
-            {
-                "name": "Robert Woods",
-                "position": "WR",
-                "team": "HOU",
-                "adp": 97,
-                "tier": "5",
-            },
-            {
-                "name": "Josh Palmer",
-                "position": "WR",
-                "team": "LAC",
-                "adp": 98,
-                "tier": "5",
-            },
-            {
-                "name": "Marvin Mims Jr.",
-                "position": "WR",
-                "team": "DEN",
-                "adp": 99,
-                "tier": "5",
-            },
-            {
-                "name": "Khalil Herbert",
-                "position": "RB",
-                "team": "CHI",
-                "adp": 100,
-                "tier": "5",
-            },
-            {
-                "name": "Jaylen Warren",
-                "position": "RB",
-                "team": "PIT",
-                "adp": 101,
-                "tier": "5",
-            },
-            {
-                "name": "Zack Moss",
-                "position": "RB",
-                "team": "CIN",
-                "adp": 102,
-                "tier": "5",
-            },
-            {
-                "name": "Roschon Johnson",
-                "position": "RB",
-                "team": "CHI",
-                "adp": 103,
-                "tier": "5",
-            },
-            {
-                "name": "Kendre Miller",
-                "position": "RB",
-                "team": "NO",
-                "adp": 104,
-                "tier": "5",
-            },
-            {
-                "name": "Tyjae Spears",
-                "position": "RB",
-                "team": "TEN",
-                "adp": 105,
-                "tier": "5",
-            },
-            {
-                "name": "Ezekiel Elliott",
-                "position": "RB",
-                "team": "DAL",
-                "adp": 106,
-                "tier": "5",
-            },
-            {
-                "name": "Gus Edwards",
-                "position": "RB",
-                "team": "LAC",
-                "adp": 107,
-                "tier": "5",
-            },
-            {
-                "name": "Raheem Mostert",
-                "position": "RB",
-                "team": "MIA",
-                "adp": 108,
-                "tier": "5",
-            },
-            {
-                "name": "Jerome Ford",
-                "position": "RB",
-                "team": "CLE",
-                "adp": 109,
-                "tier": "5",
-            },
-            {
-                "name": "Brian Robinson Jr.",
-                "position": "RB",
-                "team": "WSH",
-                "adp": 110,
-                "tier": "5",
-            },
-            {
-                "name": "Antonio Gibson",
-                "position": "RB",
-                "team": "NE",
-                "adp": 111,
-                "tier": "5",
-            },
-            {
-                "name": "Najee Harris",
-                "position": "RB",
-                "team": "LAC",
-                "adp": 112,
-                "tier": "5",
-            },
-            {
-                "name": "Dameon Pierce",
-                "position": "RB",
-                "team": "HOU",
-                "adp": 113,
-                "tier": "5",
-            },
-            {
-                "name": "Devin Singletary",
-                "position": "RB",
-                "team": "NYG",
-                "adp": 114,
-                "tier": "5",
-            },
-            {
-                "name": "Cam Akers",
-                "position": "RB",
-                "team": "MIN",
-                "adp": 115,
-                "tier": "5",
-            },
-            {
-                "name": "Cam Skattebo",
-                "position": "RB",
-                "team": "NYG",
-                "adp": 116,
-                "tier": "5",
-            },
-            {
-                "name": "Jordan Mason",
-                "position": "RB",
-                "team": "MIN",
-                "adp": 117,
-                "tier": "5",
-            },
-            {
-                "name": "Josh Allen",
-                "position": "QB",
-                "team": "BUF",
-                "adp": 118,
-                "tier": "5",
-            },
-            {
-                "name": "Lamar Jackson",
-                "position": "QB",
-                "team": "BAL",
-                "adp": 119,
-                "tier": "5",
-            },
-            {
-                "name": "Jalen Hurts",
-                "position": "QB",
-                "team": "PHI",
-                "adp": 120,
-                "tier": "5",
-            },
-            {
-                "name": "Patrick Mahomes",
-                "position": "QB",
-                "team": "KC",
-                "adp": 121,
-                "tier": "6",
-            },
-            {
-                "name": "Joe Burrow",
-                "position": "QB",
-                "team": "KC",
-                "adp": 122,
-                "tier": "6",
-            },
-            {
-                "name": "C.J. Stroud",
-                "position": "QB",
-                "team": "HOU",
-                "adp": 123,
-                "tier": "6",
-            },
-            {
-                "name": "Justin Herbert",
-                "position": "QB",
-                "team": "LAC",
-                "adp": 124,
-                "tier": "6",
-            },
-            {
-                "name": "Tua Tagovailoa",
-                "position": "QB",
-                "team": "MIA",
-                "adp": 125,
-                "tier": "6",
-            },
-            {
-                "name": "Brock Purdy",
-                "position": "QB",
-                "team": "SF",
-                "adp": 126,
-                "tier": "6",
-            },
-            {
-                "name": "Dak Prescott",
-                "position": "QB",
-                "team": "DAL",
-                "adp": 127,
-                "tier": "6",
-            },
-            {
-                "name": "Kyler Murray",
-                "position": "QB",
-                "team": "ARI",
-                "adp": 128,
-                "tier": "6",
-            },
-            {
-                "name": "Trevor Lawrence",
-                "position": "QB",
-                "team": "JAX",
-                "adp": 129,
-                "tier": "6",
-            },
-            {
-                "name": "Jared Goff",
-                "position": "QB",
-                "team": "DET",
-                "adp": 130,
-                "tier": "6",
-            },
-            {
-                "name": "Kirk Cousins",
-                "position": "QB",
-                "team": "ATL",
-                "adp": 131,
-                "tier": "6",
-            },
-            {
-                "name": "Jordan Love",
-                "position": "QB",
-                "team": "GB",
-                "adp": 132,
-                "tier": "6",
-            },
-            {
-                "name": "Bo Nix",
-                "position": "QB",
-                "team": "DEN",
-                "adp": 133,
-                "tier": "6",
-            },
-            {
-                "name": "Jayden Daniels",
-                "position": "QB",
-                "team": "WSH",
-                "adp": 134,
-                "tier": "6",
-            },
-            {
-                "name": "Deshaun Watson",
-                "position": "QB",
-                "team": "CLE",
-                "adp": 135,
-                "tier": "6",
-            },
-            {
-                "name": "Matthew Stafford",
-                "position": "QB",
-                "team": "LAR",
-                "adp": 136,
-                "tier": "6",
-            },
-            {
-                "name": "Anthony Richardson",
-                "position": "QB",
-                "team": "IND",
-                "adp": 137,
-                "tier": "6",
-            },
-            {
-                "name": "Brock Bowers",
-                "position": "TE",
-                "team": "LV",
-                "adp": 138,
-                "tier": "6",
-            },
-            {
-                "name": "Trey McBride",
-                "position": "TE",
-                "team": "ARI",
-                "adp": 139,
-                "tier": "6",
-            },
-            {
-                "name": "George Kittle",
-                "position": "TE",
-                "team": "SF",
-                "adp": 140,
-                "tier": "6",
-            },
-            {
-                "name": "Sam LaPorta",
-                "position": "TE",
-                "team": "DET",
-                "adp": 141,
-                "tier": "6",
-            },
-            {
-                "name": "Travis Kelce",
-                "position": "TE",
-                "team": "KC",
-                "adp": 142,
-                "tier": "6",
-            },
-            {
-                "name": "T.J. Hockenson",
-                "position": "TE",
-                "team": "MIN",
-                "adp": 143,
-                "tier": "6",
-            },
-            {
-                "name": "Mark Andrews",
-                "position": "TE",
-                "team": "BAL",
-                "adp": 144,
-                "tier": "6",
-            },
-            {
-                "name": "David Njoku",
-                "position": "TE",
-                "team": "CLE",
-                "adp": 145,
-                "tier": "6",
-            },
-            {
-                "name": "Evan Engram",
-                "position": "TE",
-                "team": "JAX",
-                "adp": 146,
-                "tier": "6",
-            },
-            {
-                "name": "Dalton Kincaid",
-                "position": "QB",
-                "team": "BUF",
-                "adp": 147,
-                "tier": "6",
-            },
-            {
-                "name": "Dallas Goedert",
-                "position": "TE",
-                "team": "PHI",
-                "adp": 148,
-                "tier": "6",
-            },
-            {
-                "name": "Pat Freiermuth",
-                "position": "TE",
-                "team": "PIT",
-                "adp": 149,
-                "tier": "6",
-            },
-            {
-                "name": "Kyle Pitts",
-                "position": "TE",
-                "team": "ATL",
-                "adp": 150,
-                "tier": "6",
-            },
-            {
-                "name": "Cole Kmet",
-                "position": "TE",
-                "team": "CHI",
-                "adp": 151,
-                "tier": "6",
-            },
-            {
-                "name": "Tyler Warren",
-                "position": "TE",
-                "team": "IND",
-                "adp": 152,
-                "tier": "6",
-            },
-            {
-                "name": "Cade Otton",
-                "position": "TE",
-                "team": "TB",
-                "adp": 153,
-                "tier": "6",
-            },
-            {
-                "name": "Brenton Strange",
-                "position": "TE",
-                "team": "JAX",
-                "adp": 154,
-                "tier": "6",
-            },
-            {
-                "name": "Jake Ferguson",
-                "position": "TE",
-                "team": "DAL",
-                "adp": 155,
-                "tier": "6",
-            },
-            {
-                "name": "Luke Musgrave",
-                "position": "TE",
-                "team": "GB",
-                "adp": 156,
-                "tier": "6",
-            },
-            {
-                "name": "Hunter Henry",
-                "position": "TE",
-                "team": "NE",
-                "adp": 157,
-                "tier": "6",
-            },
-            {
-                "name": "Zamir White",
-                "position": "RB",
-                "team": "LV",
-                "adp": 158,
-                "tier": "6",
-            },
-            {
-                "name": "Ty Chandler",
-                "position": "RB",
-                "team": "MIN",
-                "adp": 159,
-                "tier": "6",
-            },
-            {
-                "name": "Chase Edmonds",
-                "position": "RB",
-                "team": "TB",
-                "adp": 160,
-                "tier": "6",
-            },
-        ]
-
-    def retrain_model(self):
-        """Retrain the ML model with new data"""
-        print("Retraining ML models...")
-        self.train_models()
-        return {"message": "Models retrained successfully"}
+    def get_sample_players(self) -> List[SamplePlayer]:
+        """Get sample player data - one row per player from CSV"""
+        return list(_load_sample_players())
+
+    def get_available_board_players(self, drafted: FrozenSet[str]) -> List[Player]:
+        """Sample board players whose names haven't been drafted yet"""
+        return [p for p in _load_board_players() if p.name not in drafted]
+
+    def retrain_model(self, on_complete: Optional[Callable[[], None]] = None) -> Dict[str, str]:
+        """Queue a retrain in a background process; the new model is swapped in when done
+
+        The job status lives in RETRAIN_STATUS_DIR so any worker can answer polls, and
+        the other workers pick up the rewritten artifact through reload_if_changed().
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn, so the worker doesn't inherit the server's threads via fork
+                self._executor = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                )
+            job_id = uuid.uuid4().hex
+            _write_retrain_status(job_id, "running")
+            future = self._executor.submit(_train_models_worker)
+
+        def install(done: Future):
+            error = None if done.cancelled() else done.exception()
+            if done.cancelled() or error is not None:
+                logger.error("Model retrain %s failed", job_id, exc_info=error)
+                _write_retrain_status(job_id, "failed")
+                return
+            # The worker saved the artifact; serve it here now, other workers reload it
+            with self._reload_lock:
+                self._install_artifact(done.result())
+                self._loaded_stamp = _artifact_stamp()
+            if on_complete is not None:
+                on_complete()
+            _write_retrain_status(job_id, "completed")
+            logger.info("Model retrain %s finished", job_id)
+
+        future.add_done_callback(install)
+        logger.info("Queued model retrain %s", job_id)
+        return {"message": "Model retrain queued", "job_id": job_id}
+
+    def get_retrain_status(self, job_id: str) -> Optional[Dict[str, str]]:
+        """Status of a queued retrain, or None for an unknown job id"""
+        if not re.fullmatch(r"[0-9a-f]{32}", job_id):
+            return None
+        try:
+            with open(_retrain_status_path(job_id), encoding="utf-8") as f:
+                status = f.read()
+        except FileNotFoundError:
+            return None
+        return {"job_id": job_id, "status": status}
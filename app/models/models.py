@@ -1,23 +1,37 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Player:
     name: str
     position: str
-    team: str
-    adp: int
-    tier: str
+    # Clients send tiers as "1" or 1, fractional ADPs, and null teams for free agents
+    team: Optional[str]
+    adp: Union[int, float]
+    tier: Union[int, str]
+    # Optional stats; when present they adjust risk_factor and upside_potential
     age: Optional[int] = None
     experience: Optional[int] = None
     strength_of_schedule: Optional[float] = None
     injury_history: Optional[bool] = None
+    bye_week: Optional[int] = None
+
 
+@dataclass(slots=True, frozen=True)
+class SamplePlayer:
+    """One row of the bundled sample player board"""
 
-@dataclass
+    name: str
+    position: str
+    team: str
+    adp: int
+    tier: str
+
+
+@dataclass(slots=True)
 class Recommendation:
     player: Player
     score: float
@@ -33,7 +47,11 @@ class Recommendation:
     round_score: float
 
 
-@dataclass
+# Position counts the derived roster totals are computed from
+_COUNTED_POSITIONS = frozenset(("QB", "RB", "WR", "TE", "K", "DST"))
+
+
+@dataclass(slots=True)
 class RosterCounts:
     QB: int = 0
     RB: int = 0
@@ -43,100 +61,115 @@ class RosterCounts:
     DST: int = 0
     FLEX: int = 0  # RB/WR/TE beyond starters
     BENCH: int = 0  # Total bench spots used
+    # (total, flex eligible, bench used), computed on first use after a count changes
+    _derived: Optional[Tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _COUNTED_POSITIONS:
+            object.__setattr__(self, "_derived", None)
+
+    def _derived_counts(self) -> Tuple[int, int, int]:
+        derived = self._derived
+        if derived is None:
+            total = self.QB + self.RB + self.WR + self.TE + self.K + self.DST
+            flex = max(0, (self.RB - 2) + (self.WR - 2) + (self.TE - 1))
+            starters = 1 + 2 + 2 + 1 + 1 + 1  # QB + 2 RB + 2 WR + TE + K + DST
+            derived = (total, flex, max(0, total - starters - flex))
+            self._derived = derived
+        return derived
 
     def get_total_players(self) -> int:
         """Get total players on roster"""
-        return self.QB + self.RB + self.WR + self.TE + self.K + self.DST
+        return self._derived_counts()[0]
 
     def get_flex_eligible(self) -> int:
         """Get players eligible for flex position (RB/WR/TE beyond starters)"""
-        return max(0, (self.RB - 2) + (self.WR - 2) + (self.TE - 1))
+        return self._derived_counts()[1]
 
     def get_bench_used(self) -> int:
         """Get how many bench spots are used"""
-        starters = 1 + 2 + 2 + 1 + 1 + 1  # QB + 2 RB + 2 WR + TE + K + DST
-        flex = self.get_flex_eligible()
-        return max(0, self.get_total_players() - starters - flex)
+        return self._derived_counts()[2]
 
     def is_position_filled(self, position: str) -> bool:
         """Check if a position requirement is filled"""
-        if position == "QB":
-            return self.QB >= 1
-        elif position == "RB":
-            return self.RB >= 2
-        elif position == "WR":
-            return self.WR >= 2
-        elif position == "TE":
-            return self.TE >= 1
-        elif position == "K":
-            return self.K >= 1
-        elif position == "DST":
-            return self.DST >= 1
-        elif position == "FLEX":
-            return self.get_flex_eligible() >= 1
-        return False
-
-    def get_critical_needs(self) -> List[str]:
+        filled = _POSITION_FILLED.get(position)
+        return filled is not None and filled(self)
+
+    def get_critical_needs(self) -> Tuple[str, ...]:
         """Get list of critical position needs"""
-        needs = []
-        if self.QB < 1:
-            needs.append("QB")
-        if self.RB < 2:
-            needs.append("RB")
-        if self.WR < 2:
-            needs.append("WR")
-        if self.TE < 1:
-            needs.append("TE")
-        if self.K < 1:
-            needs.append("K")
-        if self.DST < 1:
-            needs.append("DST")
-        return needs
-
-    def get_depth_needs(self) -> List[str]:
+        return _CRITICAL_NEEDS[
+            (self.QB < 1)
+            | (self.RB < 2) << 1
+            | (self.WR < 2) << 2
+            | (self.TE < 1) << 3
+            | (self.K < 1) << 4
+            | (self.DST < 1) << 5
+        ]
+
+    def get_depth_needs(self) -> Tuple[str, ...]:
         """Get list of depth needs (positions that could use more players)"""
-        needs = []
-        if self.RB < 4:  # Want at least 4 RBs total
-            needs.append("RB")
-        if self.WR < 4:  # Want at least 4 WRs total
-            needs.append("WR")
-        if self.TE < 2:  # Want at least 2 TEs total
-            needs.append("TE")
-        if self.QB < 2:  # Want at least 2 QBs total
-            needs.append("QB")
-        return needs
+        # Want at least 4 RBs, 4 WRs, 2 TEs and 2 QBs total
+        return _DEPTH_NEEDS[
+            (self.RB < 4) | (self.WR < 4) << 1 | (self.TE < 2) << 2 | (self.QB < 2) << 3
+        ]
 
     def can_add_position(self, position: str, current_round: int) -> bool:
         """Check if we can add a player at this position given current roster and round"""
-        if position == "QB":
-            # Can always add QB if we don't have one, or add backup in later rounds
-            return self.QB < 1 or (current_round >= 8 and self.QB < 2)
-        elif position == "RB":
-            # Need at least 2, can add more for depth
-            return self.RB < 2 or (current_round >= 6 and self.RB < 5)
-        elif position == "WR":
-            # Need at least 2, can add more for depth
-            return self.WR < 2 or (current_round >= 6 and self.WR < 5)
-        elif position == "TE":
-            # Need at least 1, can add backup in later rounds
-            return self.TE < 1 or (current_round >= 10 and self.TE < 2)
-        elif position == "K":
-            # Must have K by round 16 - allow in rounds 14-16
-            return (current_round >= 14 and self.K < 1) or (
-                current_round >= 16 and self.K < 1
-            )
-        elif position == "DST":
-            # Must have DST by round 16 - allow in rounds 14-16
-            return (current_round >= 14 and self.DST < 1) or (
-                current_round >= 16 and self.DST < 1
-            )
-        return False
+        can_add = _CAN_ADD_POSITION.get(position)
+        return can_add is not None and can_add(self, current_round)
+
+
+def _needs_table(positions: Tuple[str, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Needs tuple for every bitmask over positions (bit i set = positions[i] needed)"""
+    return tuple(
+        tuple(pos for bit, pos in enumerate(positions) if mask >> bit & 1)
+        for mask in range(1 << len(positions))
+    )
+
+
+_CRITICAL_NEEDS = _needs_table(("QB", "RB", "WR", "TE", "K", "DST"))
+_DEPTH_NEEDS = _needs_table(("RB", "WR", "TE", "QB"))
+
+# Starter requirement per position (FLEX is filled by any RB/WR/TE beyond starters)
+_POSITION_FILLED = {
+    "QB": lambda counts: counts.QB >= 1,
+    "RB": lambda counts: counts.RB >= 2,
+    "WR": lambda counts: counts.WR >= 2,
+    "TE": lambda counts: counts.TE >= 1,
+    "K": lambda counts: counts.K >= 1,
+    "DST": lambda counts: counts.DST >= 1,
+    "FLEX": lambda counts: counts.get_flex_eligible() >= 1,
+}
+
+# Whether another player at a position fits the roster in a given round
+_CAN_ADD_POSITION = {
+    # Can always add QB if we don't have one, or add backup in later rounds
+    "QB": lambda counts, rnd: counts.QB < 1 or (rnd >= 8 and counts.QB < 2),
+    # Need at least 2 RBs/WRs, can add more for depth
+    "RB": lambda counts, rnd: counts.RB < 2 or (rnd >= 6 and counts.RB < 5),
+    "WR": lambda counts, rnd: counts.WR < 2 or (rnd >= 6 and counts.WR < 5),
+    # Need at least 1 TE, can add backup in later rounds
+    "TE": lambda counts, rnd: counts.TE < 1 or (rnd >= 10 and counts.TE < 2),
+    # Must have K and DST by round 16 - allow in rounds 14-16
+    "K": lambda counts, rnd: rnd >= 14 and counts.K < 1,
+    "DST": lambda counts, rnd: rnd >= 14 and counts.DST < 1,
+}
 
 
 # Pydantic models for API requests/responses
 class DraftRequest(BaseModel):
-    available_players: List[Dict[str, Any]]
-    current_roster: List[Dict[str, Any]]
+    # Read-only once validated; unknown keys (e.g. the frontend's "rounds") are ignored
+    model_config = ConfigDict(frozen=True)
+
+    # Parsed straight into Player dataclasses so the endpoint doesn't rebuild them.
+    # Clients drafting from the /api/players board can omit available_players and
+    # send only the names drafted so far; the rest of the board is then available.
+    available_players: Optional[List[Player]] = None
+    drafted_players: List[str] = []
+    current_roster: List[Player]
     current_round: int
     draft_slot: int
     teams: int
@@ -144,8 +177,11 @@ class DraftRequest(BaseModel):
 
 
 class DraftResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     recommendations: List[Dict[str, Any]]
-    strategy: str
-    insights: List[str]
-    next_round_focus: str
-    risk_assessment: str
+    # Insight sections are omitted when not requested via ?include=
+    strategy: Optional[str] = None
+    insights: Optional[List[str]] = None
+    next_round_focus: Optional[str] = None
+    risk_assessment: Optional[str] = None
@@ -4,15 +4,40 @@ Draft Intelligence Testing Framework
 Tests smart drafting logic, roster optimization, and ADP deviation reasoning
 """
 
+import gzip
 import pytest
 import requests
 import json
-from typing import List, Dict, Any
+import orjson
+import numpy as np
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 
 BASE_URL = "http://localhost:8000"
+# The tester only reads recommendations, so skip the optional insight sections
+RECOMMENDATIONS_ONLY = {"include": "recommendations"}
 
-@dataclass
+# Starting lineup slots per position; extra players at a position go to the bench
+STARTER_SLOTS = {"QB": 1, "RB": 2, "WR": 2, "TE": 1, "K": 1, "DST": 1}
+
+# Starters required before a pick counts as filling a critical need, and its explanation
+CRITICAL_NEED_RULES = {
+    "QB": (1, "Critical QB need (no QB on roster)"),
+    "RB": (2, "Critical RB need (need 2 starters)"),
+    "WR": (2, "Critical WR need (need 2 starters)"),
+    "TE": (1, "Critical TE need (no TE on roster)"),
+}
+
+# Position vocabulary for roster strength, with the ideal roster structure:
+# 1 QB, 4-5 RB, 4-5 WR, 1-2 TE, 1 K, 1 DST
+POSITIONS = ("QB", "RB", "WR", "TE", "K", "DST")
+POSITION_INDEX = {pos: i for i, pos in enumerate(POSITIONS)}
+IDEAL_COUNTS = np.array([1, 4.5, 4.5, 1.5, 1, 1])
+# Balance penalty for having no QB (heavy), TE, K or DST
+MISSING_POSITION_PENALTY = np.array([0.5, 0, 0, 0.3, 0.2, 0.2])
+
+@dataclass(slots=True, frozen=True)
 class Player:
     name: str
     position: str
@@ -20,7 +45,7 @@ class Player:
     adp: int
     tier: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DraftResult:
     round: int
     pick_number: int
@@ -30,6 +55,13 @@ class DraftResult:
     recommendations: List[Dict]
     reasoning: str
 
+@lru_cache(maxsize=256)
+def _pick_number(round_num: int, draft_slot: int, teams: int) -> int:
+    """Overall pick number for a draft slot in a snake draft"""
+    if round_num % 2 == 1:
+        return (round_num - 1) * teams + draft_slot
+    return round_num * teams - draft_slot + 1
+
 class DraftIntelligenceTester:
     """Tests the intelligence of our draft recommendations"""
     
@@ -38,6 +70,10 @@ class DraftIntelligenceTester:
         self.draft_slot = 1
         self.teams = 10
         self.rounds = 16
+        # One keep-alive connection for every API call the tester makes; bodies are
+        # pre-encoded with orjson, so the JSON content type is set once here
+        self.session = requests.Session()
+        self.session.headers["Content-Type"] = "application/json"
         
     def _load_test_players(self) -> List[Player]:
         """Load comprehensive test player data"""
@@ -87,75 +123,103 @@ class DraftIntelligenceTester:
             Player("Evan McPherson", "K", "CIN", 203, "6"),
         ]
     
+    def close(self) -> None:
+        """Close the tester's pooled HTTP connection"""
+        self.session.close()
+    
+    def _request_payload(self, available_players: List[Player],
+                         current_roster: List[Player],
+                         current_round: int,
+                         roster_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        """Build the /api/recommend request body for one draft state
+        
+        Players stay as dataclasses; orjson encodes them as JSON objects directly.
+        """
+        if roster_counts is None:
+            roster_counts = self._calculate_roster_counts(current_roster)
+        return {
+            "available_players": available_players,
+            "current_roster": current_roster,
+            "current_round": current_round,
+            "draft_slot": self.draft_slot,
+            "teams": self.teams,
+            "rounds": self.rounds,
+            "roster_counts": roster_counts
+        }
+    
     def get_recommendations(self, available_players: List[Player], 
                            current_roster: List[Player], 
-                           current_round: int) -> List[Dict]:
+                           current_round: int,
+                           roster_counts: Optional[Dict[str, int]] = None) -> List[Dict]:
         """Get recommendations from the API"""
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{BASE_URL}/api/recommend",
-                json={
-                    "available_players": [
-                        {
-                            "name": p.name,
-                            "position": p.position,
-                            "team": p.team,
-                            "adp": p.adp,
-                            "tier": p.tier
-                        } for p in available_players
-                    ],
-                    "current_roster": [
-                        {
-                            "name": p.name,
-                            "position": p.position,
-                            "team": p.team,
-                            "adp": p.adp,
-                            "tier": p.tier
-                        } for p in current_roster
-                    ],
-                    "current_round": current_round,
-                    "draft_slot": self.draft_slot,
-                    "teams": self.teams,
-                    "rounds": self.rounds,
-                    "roster_counts": self._calculate_roster_counts(current_roster)
-                },
-                headers={"Content-Type": "application/json"}
+                params=RECOMMENDATIONS_ONLY,
+                data=orjson.dumps(
+                    self._request_payload(available_players, current_roster, current_round, roster_counts)
+                )
             )
             
             if response.status_code == 200:
-                return response.json().get("recommendations", [])
+                return orjson.loads(response.content).get("recommendations", [])
             else:
                 raise Exception(f"API error: {response.status_code}")
                 
         except Exception as e:
             pytest.fail(f"Failed to get recommendations: {e}")
     
+    def get_batch_recommendations(self, states: List[tuple]) -> List[List[Dict]]:
+        """Get recommendations for several (available, roster, round) states in one call"""
+        try:
+            response = self.session.post(
+                f"{BASE_URL}/api/recommend/batch",
+                params=RECOMMENDATIONS_ONLY,
+                data=orjson.dumps([self._request_payload(*state) for state in states])
+            )
+            
+            if response.status_code == 200:
+                return [result.get("recommendations", []) for result in orjson.loads(response.content)]
+            else:
+                raise Exception(f"API error: {response.status_code}")
+                
+        except Exception as e:
+            pytest.fail(f"Failed to get batch recommendations: {e}")
+    
     def _calculate_roster_counts(self, roster: List[Player]) -> Dict[str, int]:
         """Calculate current roster position counts"""
-        counts = {"QB": 0, "RB": 0, "WR": 0, "TE": 0, "K": 0, "DST": 0, "FLEX": 0, "BENCH": 0}
+        counts = {**dict.fromkeys(STARTER_SLOTS, 0), "FLEX": 0, "BENCH": 0}
         
         for player in roster:
-            if player.position in counts:
-                counts[player.position] += 1
-            counts["BENCH"] += 1
+            self._add_to_roster_counts(counts, player.position)
             
         return counts
     
+    def _add_to_roster_counts(self, counts: Dict[str, int], position: str) -> None:
+        """Record one more drafted player at position in a running roster count"""
+        if position in STARTER_SLOTS:
+            counts[position] += 1
+            if counts[position] <= STARTER_SLOTS[position]:
+                return
+        counts["BENCH"] += 1
+    
     def simulate_draft(self) -> List[DraftResult]:
         """Simulate a complete draft and track all decisions"""
         current_roster = []
-        available_players = self.test_players.copy()
+        roster_counts = self._calculate_roster_counts(current_roster)
+        # Undrafted players keyed by name, so each pick is a single pop
+        available = {p.name: p for p in self.test_players}
         draft_results = []
         
         for round_num in range(1, 17):
             # Calculate pick number
-            if round_num % 2 == 1:
-                pick_num = (round_num - 1) * 10 + self.draft_slot
-            else:
-                pick_num = round_num * 10 - self.draft_slot + 1
+            pick_num = _pick_number(round_num, self.draft_slot, self.teams)
             
             # Get recommendations
-            recommendations = self.get_recommendations(available_players, current_roster, round_num)
+            available_players = list(available.values())
+            recommendations = self.get_recommendations(
+                available_players, current_roster, round_num, roster_counts
+            )
             
             if not recommendations:
                 pytest.fail(f"No recommendations for round {round_num}")
@@ -172,7 +236,7 @@ class DraftIntelligenceTester:
             
             # Analyze the decision
             reasoning = self._analyze_draft_decision(
-                selected_player, recommendations, current_roster, round_num
+                selected_player, recommendations, current_roster, round_num, roster_counts
             )
             
             # Record the result
@@ -180,7 +244,7 @@ class DraftIntelligenceTester:
                 round=round_num,
                 pick_number=pick_num,
                 selected_player=selected_player,
-                available_players=available_players.copy(),
+                available_players=available_players,
                 current_roster=current_roster.copy(),
                 recommendations=recommendations,
                 reasoning=reasoning
@@ -188,7 +252,8 @@ class DraftIntelligenceTester:
             
             # Update state
             current_roster.append(selected_player)
-            available_players = [p for p in available_players if p.name != selected_player.name]
+            self._add_to_roster_counts(roster_counts, selected_player.position)
+            available.pop(selected_player.name, None)
             
             print(f"Round {round_num}: {selected_player.name} ({selected_player.position}) - ADP {selected_player.adp}")
             print(f"  Reasoning: {reasoning}")
@@ -198,27 +263,24 @@ class DraftIntelligenceTester:
     def _analyze_draft_decision(self, selected_player: Player, 
                                recommendations: List[Dict], 
                                current_roster: List[Player], 
-                               round_num: int) -> str:
+                               round_num: int,
+                               roster_counts: Optional[Dict[str, int]] = None) -> str:
         """Analyze why this player was selected"""
         reasoning = []
         
         # Check if this was the highest ADP available
-        available_adps = [r["player"]["adp"] for r in recommendations]
-        if selected_player.adp == min(available_adps):
+        highest_adp = min(r["player"]["adp"] for r in recommendations)
+        if selected_player.adp == highest_adp:
             reasoning.append("Highest ADP available")
         else:
-            reasoning.append(f"ADP {selected_player.adp} selected over ADP {min(available_adps)}")
+            reasoning.append(f"ADP {selected_player.adp} selected over ADP {highest_adp}")
         
         # Check positional need
-        roster_counts = self._calculate_roster_counts(current_roster)
-        if selected_player.position == "QB" and roster_counts["QB"] == 0:
-            reasoning.append("Critical QB need (no QB on roster)")
-        elif selected_player.position == "RB" and roster_counts["RB"] < 2:
-            reasoning.append("Critical RB need (need 2 starters)")
-        elif selected_player.position == "WR" and roster_counts["WR"] < 2:
-            reasoning.append("Critical WR need (need 2 starters)")
-        elif selected_player.position == "TE" and roster_counts["TE"] == 0:
-            reasoning.append("Critical TE need (no TE on roster)")
+        if roster_counts is None:
+            roster_counts = self._calculate_roster_counts(current_roster)
+        need_rule = CRITICAL_NEED_RULES.get(selected_player.position)
+        if need_rule is not None and roster_counts[selected_player.position] < need_rule[0]:
+            reasoning.append(need_rule[1])
         
         # Check round appropriateness
         if round_num <= 3 and selected_player.adp > 30:
@@ -234,54 +296,36 @@ class DraftIntelligenceTester:
             return {"total_score": 0, "positional_balance": 0, "adp_efficiency": 0}
         
         # Calculate total ADP score (lower is better)
-        total_adp = sum(p.adp for p in roster)
-        avg_adp = total_adp / len(roster)
+        adps = np.fromiter((p.adp for p in roster), dtype=np.int32, count=len(roster))
+        avg_adp = float(adps.mean())
         
         # Calculate positional balance
-        position_counts = {}
-        for player in roster:
-            pos = player.position
-            position_counts[pos] = position_counts.get(pos, 0) + 1
+        counts = np.bincount(
+            np.fromiter((POSITION_INDEX[p.position] for p in roster), dtype=np.int8, count=len(roster)),
+            minlength=len(POSITIONS)
+        )
+        position_counts = {pos: int(n) for pos, n in zip(POSITIONS, counts) if n}
         
-        # Ideal roster structure: 1 QB, 4-5 RB, 4-5 WR, 1-2 TE, 1 K, 1 DST
-        ideal_structure = {"QB": 1, "RB": 4.5, "WR": 4.5, "TE": 1.5, "K": 1, "DST": 1}
-        balance_score = 0
-        
-        for pos, ideal in ideal_structure.items():
-            actual = position_counts.get(pos, 0)
-            if abs(actual - ideal) <= 1:
-                balance_score += 1
-            elif abs(actual - ideal) <= 2:
-                balance_score += 0.5
-            else:
-                # Penalize for being way off ideal
-                balance_score += 0.1
+        # Full credit within 1 of ideal, half within 2, otherwise way off ideal
+        deviation = np.abs(counts - IDEAL_COUNTS)
+        balance_score = np.where(deviation <= 1, 1.0, np.where(deviation <= 2, 0.5, 0.1)).sum()
         
         # Additional penalties for critical imbalances
         # Penalty for missing critical positions
-        if position_counts.get('QB', 0) == 0:
-            balance_score -= 0.5  # Heavy penalty for no QB
-        if position_counts.get('TE', 0) == 0:
-            balance_score -= 0.3  # Penalty for no TE
-        if position_counts.get('K', 0) == 0:
-            balance_score -= 0.2  # Penalty for no K
-        if position_counts.get('DST', 0) == 0:
-            balance_score -= 0.2  # Penalty for no DST
+        balance_score -= MISSING_POSITION_PENALTY[counts == 0].sum()
         
-        # Penalty for extreme position stacking
-        for pos, count in position_counts.items():
-            if count > 6:  # Too many of one position
-                balance_score -= 0.3 * (count - 6)
+        # Penalty for extreme position stacking (more than 6 of one position)
+        balance_score -= 0.3 * np.maximum(counts - 6, 0).sum()
         
         # Ensure balance score doesn't go below 0
-        balance_score = max(0, balance_score)
+        balance_score = max(0.0, float(balance_score))
         
         # ADP efficiency (how well we followed ADP)
         adp_efficiency = 100 - (avg_adp / 200 * 100)  # Higher is better
         
         return {
             "total_score": len(roster),
-            "positional_balance": balance_score / len(ideal_structure) * 100,
+            "positional_balance": balance_score / len(POSITIONS) * 100,
             "adp_efficiency": adp_efficiency,
             "avg_adp": avg_adp,
             "position_counts": position_counts
@@ -290,7 +334,9 @@ class DraftIntelligenceTester:
 # Test fixtures
 @pytest.fixture
 def draft_tester():
-    return DraftIntelligenceTester()
+    tester = DraftIntelligenceTester()
+    yield tester
+    tester.close()
 
 # Test cases
 def test_basic_draft_logic(draft_tester):
@@ -324,6 +370,100 @@ def test_roster_need_prioritization(draft_tester):
     assert recommendations[0]["player"]["position"] == "WR"
     print(f"✅ WR prioritized over RB despite ADP: {recommendations[0]['player']['name']}")
 
+def test_roster_counts_bench(draft_tester):
+    """Test that BENCH counts only players beyond the starter slots"""
+    players = {p.name: p for p in draft_tester.test_players}
+    roster = [players[name] for name in (
+        "Josh Allen", "Lamar Jackson",                                   # 1 QB starter + 1 bench
+        "Bijan Robinson", "Saquon Barkley", "Jahmyr Gibbs",              # 2 RB starters + 1 bench
+        "Ja'Marr Chase", "Justin Jefferson",                             # 2 WR starters
+        "Travis Kelce",                                                  # 1 TE starter
+        "Justin Tucker", "Evan McPherson",                               # 1 K starter + 1 bench
+    )]
+
+    counts = draft_tester._calculate_roster_counts(roster)
+
+    assert counts == {"QB": 2, "RB": 3, "WR": 2, "TE": 1, "K": 2, "DST": 0, "FLEX": 0, "BENCH": 3}
+    assert draft_tester._calculate_roster_counts([]) == dict.fromkeys(counts, 0)
+
+    # Drafting one at a time keeps the same running counts
+    running = draft_tester._calculate_roster_counts([])
+    for player in roster:
+        draft_tester._add_to_roster_counts(running, player.position)
+    assert running == counts
+
+def test_batch_recommendations(draft_tester):
+    """Test that the batch endpoint matches individual recommendation calls"""
+    players = draft_tester.test_players
+    states = [
+        (players[:5], [], 1),
+        (players[3:20], players[:3], 4),
+        (players[20:], players[:11], 12),
+    ]
+    
+    batch = draft_tester.get_batch_recommendations(states)
+    
+    assert len(batch) == len(states)
+    for state, recommendations in zip(states, batch):
+        assert recommendations == draft_tester.get_recommendations(*state)
+
+def test_loose_player_fields(draft_tester):
+    """Test that integer tiers, fractional ADPs and null teams are accepted"""
+    body = {
+        "available_players": [
+            {"name": "Free Agent RB", "position": "RB", "team": None, "adp": 5.5, "tier": 1},
+            {"name": "CeeDee Lamb", "position": "WR", "team": "DAL", "adp": 6, "tier": "1"},
+        ],
+        "current_roster": [
+            {"name": "Bijan Robinson", "position": "RB", "team": None, "adp": 2.5, "tier": 1},
+        ],
+        "current_round": 2,
+        "draft_slot": 1,
+        "teams": 10,
+    }
+
+    response = draft_tester.session.post(
+        f"{BASE_URL}/api/recommend", params=RECOMMENDATIONS_ONLY, data=orjson.dumps(body)
+    )
+
+    assert response.status_code == 200
+    players = {rec["player"]["name"]: rec["player"] for rec in orjson.loads(response.content)["recommendations"]}
+    assert players["Free Agent RB"] == body["available_players"][0]
+
+def test_gzip_request_body(draft_tester):
+    """Test that a gzip-compressed request body gets the same recommendations"""
+    state = (draft_tester.test_players[10:40], draft_tester.test_players[:4], 3)
+
+    response = draft_tester.session.post(
+        f"{BASE_URL}/api/recommend",
+        params=RECOMMENDATIONS_ONLY,
+        data=gzip.compress(orjson.dumps(draft_tester._request_payload(*state))),
+        headers={"Content-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["recommendations"] == draft_tester.get_recommendations(*state)
+
+def test_drafted_players_delta(draft_tester):
+    """Test that sending drafted names matches sending the remaining board explicitly"""
+    board = [
+        Player(p["name"], p["position"], p["team"], p["adp"], p["tier"])
+        for p in orjson.loads(draft_tester.session.get(f"{BASE_URL}/api/players").content)["players"]
+    ]
+    drafted = [p.name for p in board[:25]]
+    roster = board[:25:10]
+    payload = draft_tester._request_payload([], roster, 4)
+    del payload["available_players"]
+
+    response = draft_tester.session.post(
+        f"{BASE_URL}/api/recommend",
+        params=RECOMMENDATIONS_ONLY,
+        data=orjson.dumps({**payload, "drafted_players": drafted})
+    )
+
+    assert response.status_code == 200
+    assert orjson.loads(response.content)["recommendations"] == draft_tester.get_recommendations(board[25:], roster, 4)
+
 def test_complete_draft_simulation(draft_tester):
     """Test complete 16-round draft simulation"""
     print("\n🏈 SIMULATING COMPLETE DRAFT")
@@ -360,10 +500,12 @@ def test_adp_deviation_reasoning(draft_tester):
     
     # Simulate a few rounds to see ADP deviations
     current_roster = []
-    available_players = draft_tester.test_players[:10].copy()
+    available = {p.name: p for p in draft_tester.test_players[:10]}
     
     for round_num in range(1, 4):
-        recommendations = draft_tester.get_recommendations(available_players, current_roster, round_num)
+        recommendations = draft_tester.get_recommendations(
+            list(available.values()), current_roster, round_num
+        )
         
         if recommendations:
             top_rec = recommendations[0]
@@ -376,8 +518,7 @@ def test_adp_deviation_reasoning(draft_tester):
             )
             
             # Check if this was the highest ADP available
-            available_adps = [r["player"]["adp"] for r in recommendations]
-            highest_adp = min(available_adps)
+            highest_adp = min(r["player"]["adp"] for r in recommendations)
             
             if selected_player.adp != highest_adp:
                 print(f"⚠️ Round {round_num}: {selected_player.name} (ADP {selected_player.adp}) selected over {highest_adp} ADP")
@@ -396,7 +537,7 @@ def test_adp_deviation_reasoning(draft_tester):
             
             # Update state
             current_roster.append(selected_player)
-            available_players = [p for p in available_players if p.name != selected_player.name]
+            available.pop(selected_player.name, None)
     
     print(f"\n✅ ADP deviation reasoning test completed!")
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+DraftLogic equivalence tests
+Checks the vectorized strategy pass against the original per-recommendation loops
+"""
+
+import copy
+import random
+from typing import List
+
+import pytest
+
+from app.ml.draft_logic import DraftLogic
+from app.models.models import Player, Recommendation, RosterCounts
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DST"]
+
+
+def _reference_need_score(position: str, roster_counts: RosterCounts, current_round: int) -> float:
+    """The original DraftLogic.calculate_need_score table"""
+    base_scores = {
+        "QB": 100 if roster_counts.QB < 1 else 30,
+        "RB": 100 if roster_counts.RB < 2 else 60 if roster_counts.RB < 4 else 20,
+        "WR": 100 if roster_counts.WR < 2 else 60 if roster_counts.WR < 4 else 20,
+        "TE": 100 if roster_counts.TE < 1 else 50 if roster_counts.TE < 2 else 15,
+        "K": 100 if roster_counts.K < 1 and current_round >= 12 else 0,
+        "DST": 100 if roster_counts.DST < 1 and current_round >= 12 else 0,
+    }
+    return base_scores.get(position, 0)
+
+
+def _reference_draft_strategy(recommendations: List[Recommendation],
+                              current_round: int,
+                              roster_counts: RosterCounts) -> List[Recommendation]:
+    """The original loop-at-a-time DraftLogic.apply_draft_strategy"""
+    strategy = "balanced"
+    for rounds, focus in (((1, 2, 3), "best_available"), ((4, 5, 6, 7), "balanced"),
+                          ((8, 9, 10, 11), "depth"), ((12, 13, 14, 15, 16), "needs")):
+        if current_round in rounds:
+            strategy = focus
+            break
+
+    # Position scarcity
+    position_counts = {}
+    for rec in recommendations:
+        position_counts[rec.player.position] = position_counts.get(rec.player.position, 0) + 1
+    for rec in recommendations:
+        count = position_counts.get(rec.player.position, 0)
+        if count < 5:
+            rec.score += 30
+        elif count < 10:
+            rec.score += 20
+        elif count < 15:
+            rec.score += 10
+
+    # Roster balance
+    for rec in recommendations:
+        pos = rec.player.position
+        if pos == "RB" and roster_counts.RB < 2:
+            rec.score += 40
+        elif pos == "WR" and roster_counts.WR < 2:
+            rec.score += 40
+        elif pos == "TE" and roster_counts.TE < 1:
+            rec.score += 35
+        elif pos == "QB" and roster_counts.QB < 1:
+            rec.score += 30
+        elif pos == "RB" and roster_counts.RB < 4:
+            rec.score += 20
+        elif pos == "WR" and roster_counts.WR < 4:
+            rec.score += 20
+        elif pos == "TE" and roster_counts.TE < 2:
+            rec.score += 15
+        elif current_round >= 12:
+            if pos == "K" and roster_counts.K < 1:
+                rec.score += 50
+            elif pos == "DST" and roster_counts.DST < 1:
+                rec.score += 50
+
+    # Round constraints
+    for rec in recommendations:
+        pos = rec.player.position
+        if current_round <= 5 and pos in ["K", "DST"]:
+            rec.score -= 100
+        elif 6 <= current_round <= 10:
+            if pos in ["K", "DST"]:
+                rec.score -= 50
+            elif rec.player.adp > 100:
+                rec.score -= 20
+        elif current_round >= 11:
+            if pos in ["K", "DST"] and rec.score > 0:
+                rec.score += 30
+        if strategy == "best_available":
+            if current_round <= 3 and rec.player.adp <= 30:
+                rec.score += 25
+        elif strategy == "needs":
+            if rec.score > 100:
+                rec.score += 15
+
+    # Value vs. need balance
+    for rec in recommendations:
+        value_score = 200 - rec.player.adp
+        need_score = _reference_need_score(rec.player.position, roster_counts, current_round)
+        if current_round <= 3:
+            rec.score = rec.score * 0.7 + value_score * 0.3
+        elif current_round <= 7:
+            rec.score = rec.score * 0.8 + need_score * 0.2
+        else:
+            rec.score = rec.score * 0.6 + need_score * 0.4
+
+    recommendations.sort(key=lambda x: x.score, reverse=True)
+    return recommendations
+
+
+def _random_recommendations(rng: random.Random, n: int) -> List[Recommendation]:
+    recommendations = []
+    for i in range(n):
+        player = Player(f"Player {i}", rng.choice(POSITIONS), rng.choice(["ATL", "DAL", "KC", "SF"]),
+                        rng.randint(1, 220), str(rng.randint(1, 6)), bye_week=rng.choice([None, 5, 7, 9]))
+        score = float(rng.randint(-50, 250))
+        recommendations.append(Recommendation(player, score, [], "medium", 0.5, 0.5, 0.5,
+                                              score, 0.0, 0, 0, 0))
+    return recommendations
+
+
+def _random_roster_counts(rng: random.Random) -> RosterCounts:
+    return RosterCounts(QB=rng.randint(0, 2), RB=rng.randint(0, 5), WR=rng.randint(0, 5),
+                        TE=rng.randint(0, 2), K=rng.randint(0, 1), DST=rng.randint(0, 1))
+
+
+def _summary(recommendations: List[Recommendation]):
+    return [(rec.player.name, rec.score, rec.reasoning) for rec in recommendations]
+
+
+@pytest.mark.parametrize("current_round", range(1, 17))
+def test_draft_strategy_matches_reference(current_round):
+    """Test that the vectorized strategy pass scores and orders like the original loops"""
+    rng = random.Random(current_round)
+    draft_logic = DraftLogic()
+
+    for _ in range(25):
+        recommendations = _random_recommendations(rng, rng.randint(1, 40))
+        roster_counts = _random_roster_counts(rng)
+        expected = _reference_draft_strategy(copy.deepcopy(recommendations), current_round, roster_counts)
+
+        # The individual passes are public too, so chain them the way the original did
+        stepwise = draft_logic.apply_position_scarcity(copy.deepcopy(recommendations))
+        stepwise = draft_logic.apply_roster_balance(stepwise, roster_counts, current_round)
+        stepwise = draft_logic.apply_round_constraints(
+            stepwise, current_round, draft_logic.get_round_strategy(current_round)
+        )
+        stepwise = draft_logic.apply_value_need_balance(stepwise, current_round, roster_counts)
+        stepwise.sort(key=lambda x: x.score, reverse=True)
+
+        actual = draft_logic.apply_draft_strategy(recommendations, current_round, roster_counts)
+
+        for result in (actual, stepwise):
+            assert [rec.player.name for rec in result] == [rec.player.name for rec in expected]
+            assert [rec.score for rec in result] == pytest.approx([rec.score for rec in expected])
+
+
+def test_need_scores_match_reference():
+    """Test that the memoized need score matches the original table for every roster state"""
+    draft_logic = DraftLogic()
+    rng = random.Random(0)
+
+    for _ in range(200):
+        roster_counts = _random_roster_counts(rng)
+        current_round = rng.randint(1, 16)
+        for pos in POSITIONS + ["FLEX"]:
+            assert draft_logic.calculate_need_score(pos, roster_counts, current_round) == \
+                _reference_need_score(pos, roster_counts, current_round)
+
+
+def test_handcuff_and_bye_week_match_reference():
+    """Test the set/Counter based handcuff and bye week passes against the original scans"""
+    draft_logic = DraftLogic()
+    rng = random.Random(1)
+
+    for _ in range(50):
+        recommendations = _random_recommendations(rng, 30)
+        roster = [rec.player for rec in _random_recommendations(rng, rng.randint(0, 12))]
+        expected = copy.deepcopy(recommendations)
+
+        # Original handcuff scan: first roster RB on the same team earns the bonus once
+        my_rbs = [p for p in roster if p.position == "RB"]
+        for rec in expected:
+            if rec.player.position == "RB":
+                for my_rb in my_rbs:
+                    if my_rb.team == rec.player.team:
+                        rec.score += 25
+                        rec.reasoning.append("Handcuff")
+                        break
+
+        # Original bye week scan
+        bye_weeks = [p.bye_week for p in roster if p.bye_week]
+        for rec in expected:
+            if rec.player.bye_week and rec.player.bye_week in bye_weeks:
+                if bye_weeks.count(rec.player.bye_week) >= 2:
+                    rec.score -= 15
+                    rec.reasoning.append("Bye week conflict")
+
+        actual = draft_logic.apply_handcuff_logic(recommendations, roster)
+        actual = draft_logic.apply_bye_week_logic(actual, roster)
+
+        assert _summary(actual) == _summary(expected)
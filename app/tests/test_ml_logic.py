@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+DraftMLModel tests
+Runs the model in-process against a temporary artifact directory
+"""
+
+import pytest
+
+from app.ml import ml_logic
+from app.ml.ml_logic import DraftMLModel
+from app.models.models import Player, RosterCounts
+
+
+@pytest.fixture
+def model_dir(tmp_path, monkeypatch):
+    """Point the model artifact and retrain statuses at a temp dir, with no reload throttle"""
+    monkeypatch.setattr(ml_logic, "MODEL_PATH", str(tmp_path / "draft_models.joblib"))
+    monkeypatch.setattr(ml_logic, "RETRAIN_STATUS_DIR", str(tmp_path / "retrain_jobs"))
+    monkeypatch.setattr(ml_logic, "MODEL_RELOAD_INTERVAL", 0.0)
+    return tmp_path
+
+
+def test_other_workers_reload_retrained_artifact(model_dir):
+    """Test that a model picks up an artifact another process saved after it loaded"""
+    retrainer = DraftMLModel()  # no artifact yet, so this one trains and saves
+    worker = DraftMLModel()  # loads the saved artifact
+
+    assert not worker.reload_if_changed()
+
+    retrainer.train_models()
+
+    assert worker.reload_if_changed()
+    assert not worker.reload_if_changed()
+    assert not retrainer.reload_if_changed()  # it saved that artifact itself
+
+
+def test_retrain_status_is_shared(model_dir):
+    """Test that any model instance can report a retrain job written by another"""
+    job_id = "0123456789abcdef0123456789abcdef"
+    ml_logic._write_retrain_status(job_id, "completed")
+
+    worker = DraftMLModel(load=False)
+
+    assert worker.get_retrain_status(job_id) == {"job_id": job_id, "status": "completed"}
+    assert worker.get_retrain_status("fedcba9876543210fedcba9876543210") is None
+    assert worker.get_retrain_status("../draft_models") is None
+
+
+def test_roster_counts_fallback(model_dir):
+    """Test that omitting roster_counts counts the roster instead of failing"""
+    model = DraftMLModel(load=False)
+    roster = [
+        Player("Bijan Robinson", "RB", "ATL", 2, "1"),
+        Player("Saquon Barkley", "RB", "PHI", 3, "1"),
+        Player("Josh Allen", "QB", "BUF", 21, "3"),
+    ]
+    available = [
+        Player("Justin Jefferson", "WR", "MIN", 4, "1"),
+        Player("Jahmyr Gibbs", "RB", "DET", 5, "1"),
+        Player("Travis Kelce", "TE", "KC", 51, "4"),
+        Player("Lamar Jackson", "QB", "BAL", 22, "3"),
+    ]
+    counts = RosterCounts(QB=1, RB=2)
+
+    recommendations = model.get_recommendations(available, roster, 6, 1, 10)
+
+    expected = model.get_recommendations(available, roster, 6, 1, 10, roster_counts=counts)
+    assert [(rec.player.name, rec.score) for rec in recommendations] == \
+        [(rec.player.name, rec.score) for rec in expected]
+    for player in available:
+        assert model.calculate_positional_need(player, roster, 6) == \
+            model.calculate_positional_need(player, roster, 6, roster_counts=counts)
+
+
+def test_int_and_str_tiers_score_alike(model_dir):
+    """Test that tier=1 and tier="1" produce identical recommendations"""
+    model = DraftMLModel()
+    board = [
+        ("Justin Jefferson", "WR", "MIN", 4, 1),
+        ("Jahmyr Gibbs", "RB", "DET", 5, 1),
+        ("Puka Nacua", "WR", "LAR", 14, 2),
+        ("Travis Kelce", "TE", "KC", 51, 4),
+    ]
+    roster = [Player("Bijan Robinson", "RB", "ATL", 2, "1")]
+
+    def summary(tier_type):
+        available = [Player(name, pos, team, adp, tier_type(tier)) for name, pos, team, adp, tier in board]
+        return [
+            (rec.player.name, rec.score, rec.reasoning, rec.confidence, rec.upside_potential)
+            for rec in model.get_recommendations(available, roster, 2, 1, 10)
+        ]
+
+    assert summary(int) == summary(str)